@@ -0,0 +1,84 @@
+"""Example Python client library for the Neo4j aviation database."""
+
+from importlib import import_module
+
+# Single source of truth for the public API: module -> exported names.
+# __all__ and the re-exports below are both derived from this table, so the
+# two can never drift apart.
+_EXPORTS = (
+    (".connection", ("Neo4jConnection",)),
+    (".async_connection", ("AsyncNeo4jConnection",)),
+    (
+        ".exceptions",
+        (
+            "Neo4jClientError",
+            "ClientConnectionError",
+            "QueryError",
+            "NotFoundError",
+            "ValidationError",
+        ),
+    ),
+    (
+        ".models",
+        (
+            "Aircraft",
+            "Airport",
+            "Flight",
+            "System",
+            "Component",
+            "Sensor",
+            "Reading",
+            "MaintenanceEvent",
+            "Delay",
+        ),
+    ),
+    (
+        ".rows",
+        (
+            "AircraftRow",
+            "AirportRow",
+            "FlightRow",
+            "SystemRow",
+            "ComponentRow",
+            "SensorRow",
+            "ReadingRow",
+            "MaintenanceEventRow",
+            "DelayRow",
+            "row_from_dict",
+            "row_to_model",
+        ),
+    ),
+    (
+        ".repository",
+        (
+            "AircraftBundle",
+            "AircraftRepository",
+            "AirportRepository",
+            "FlightRepository",
+            "SystemRepository",
+            "MaintenanceEventRepository",
+            "ComponentRepository",
+            "SensorRepository",
+            "ReadingRepository",
+            "DelayRepository",
+        ),
+    ),
+    (
+        ".async_repository",
+        (
+            "AsyncAircraftRepository",
+            "AsyncAirportRepository",
+            "AsyncFlightRepository",
+            "AsyncSystemRepository",
+            "AsyncMaintenanceEventRepository",
+        ),
+    ),
+)
+
+__all__ = tuple(name for _, names in _EXPORTS for name in names)
+
+for _module_path, _names in _EXPORTS:
+    _module = import_module(_module_path, __name__)
+    for _name in _names:
+        globals()[_name] = getattr(_module, _name)
+del _module, _module_path, _name, _names, import_module
@@ -0,0 +1,85 @@
+"""Async connection management for the Neo4j aviation client.
+
+The synchronous :class:`~neo4j_client.connection.Neo4jConnection` forces
+ASGI/MCP server handlers to push Neo4j I/O onto a thread pool. This async
+sibling drives the Bolt protocol on the event loop instead, so hundreds of
+concurrent requests share one driver without thread-switch overhead.
+"""
+
+from typing import Any, Optional
+
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession
+from neo4j.exceptions import AuthError, ConfigurationError, ServiceUnavailable
+
+from .exceptions import ClientConnectionError
+
+
+class AsyncNeo4jConnection:
+    """Manages an async Neo4j driver and hands out async sessions.
+
+    Supports use as an async context manager::
+
+        async with AsyncNeo4jConnection(uri, username, password) as conn:
+            async with conn.get_session() as session:
+                result = await session.run("RETURN 1")
+    """
+
+    __slots__ = (
+        "uri",
+        "username",
+        "password",
+        "database",
+        "fetch_size",
+        "_driver",
+    )
+
+    def __init__(
+        self,
+        uri: str,
+        username: str,
+        password: str,
+        database: str = "neo4j",
+        fetch_size: int = 1000,
+    ) -> None:
+        self.uri = uri
+        self.username = username
+        self.password = password
+        self.database = database
+        self.fetch_size = fetch_size
+        self._driver: Optional[AsyncDriver] = None
+
+    async def connect(self, verify: bool = False) -> None:
+        """Open the async driver, optionally verifying connectivity."""
+        if self._driver is not None:
+            return
+        try:
+            self._driver = AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.username, self.password),
+                telemetry_disabled=True,
+                keep_alive=True,
+            )
+            if verify:
+                await self._driver.verify_connectivity()
+        except (ServiceUnavailable, AuthError, ConfigurationError) as e:
+            raise ClientConnectionError(str(e)) from e
+
+    async def aclose(self) -> None:
+        """Close the driver."""
+        if self._driver:
+            await self._driver.close()
+            self._driver = None
+
+    def get_session(self, **session_kwargs: Any) -> AsyncSession:
+        """Return a new async session bound to the configured database."""
+        if not self._driver:
+            raise ClientConnectionError("Not connected. Call connect() first.")
+        session_kwargs.setdefault("fetch_size", self.fetch_size)
+        return self._driver.session(database=self.database, **session_kwargs)
+
+    async def __aenter__(self) -> "AsyncNeo4jConnection":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
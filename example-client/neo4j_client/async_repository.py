@@ -0,0 +1,289 @@
+"""Async repository counterparts for concurrent workloads.
+
+Each class mirrors its synchronous sibling in :mod:`neo4j_client.repository`
+(and reuses its Cypher constants) but runs on
+:class:`~neo4j_client.async_connection.AsyncNeo4jConnection`, so a tool
+handler that needs several independent queries can overlap them::
+
+    aircraft, airports = await asyncio.gather(
+        aircraft_repo.find_all(), airport_repo.find_all()
+    )
+
+Latency then approaches the slowest query instead of the sum of all of
+them.
+"""
+
+from typing import List, Optional
+
+from neo4j.exceptions import Neo4jError
+
+from .async_connection import AsyncNeo4jConnection
+from .exceptions import QueryError
+from .models import Aircraft, Airport, Flight, MaintenanceEvent, System
+from .repository import (
+    AircraftRepository,
+    AirportRepository,
+    FlightRepository,
+    MaintenanceEventRepository,
+    SystemRepository,
+)
+
+
+class AsyncAircraftRepository:
+    """Async CRUD and traversal queries for :class:`Aircraft` nodes."""
+
+    _queries = AircraftRepository
+
+    def __init__(self, connection: AsyncNeo4jConnection) -> None:
+        self.connection = connection
+
+    async def create(self, aircraft: Aircraft) -> Aircraft:
+        """Create or update an aircraft node; returns the input model."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(
+                    self._queries._Q_CREATE, props=aircraft.model_dump()
+                )
+                await result.consume()
+                return aircraft
+            except Neo4jError as e:
+                raise QueryError(f"Failed to create aircraft: {e}") from e
+
+    async def find_by_id(self, aircraft_id: str) -> Optional[Aircraft]:
+        """Return the aircraft with the given id, or ``None``."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(
+                    self._queries._Q_FIND_BY_ID, aircraft_id=aircraft_id
+                )
+                record = await result.single(strict=False)
+                if record is None:
+                    return None
+                return Aircraft(**dict(record["a"]))
+            except Neo4jError as e:
+                raise QueryError(f"Failed to find aircraft: {e}") from e
+
+    async def find_all(self) -> List[Aircraft]:
+        """Return every aircraft in the database."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(self._queries._Q_FIND_ALL)
+                construct = Aircraft.model_construct
+                return [
+                    construct(**dict(record["a"])) async for record in result
+                ]
+            except Neo4jError as e:
+                raise QueryError(f"Failed to list aircraft: {e}") from e
+
+
+class AsyncAirportRepository:
+    """Async CRUD queries for :class:`Airport` nodes."""
+
+    _queries = AirportRepository
+
+    def __init__(self, connection: AsyncNeo4jConnection) -> None:
+        self.connection = connection
+
+    async def find_by_iata(self, iata: str) -> Optional[Airport]:
+        """Return the airport with the given IATA code, or ``None``."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(
+                    self._queries._Q_FIND_BY_IATA, iata=iata
+                )
+                record = await result.single(strict=False)
+                if record is None:
+                    return None
+                return Airport(**dict(record["a"]))
+            except Neo4jError as e:
+                raise QueryError(f"Failed to find airport: {e}") from e
+
+    async def find_all(self) -> List[Airport]:
+        """Return every airport in the database."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(self._queries._Q_FIND_ALL)
+                construct = Airport.model_construct
+                return [
+                    construct(**dict(record["a"])) async for record in result
+                ]
+            except Neo4jError as e:
+                raise QueryError(f"Failed to list airports: {e}") from e
+
+
+class AsyncFlightRepository:
+    """Async CRUD queries for :class:`Flight` nodes."""
+
+    _queries = FlightRepository
+
+    def __init__(self, connection: AsyncNeo4jConnection) -> None:
+        self.connection = connection
+
+    async def create(self, flight: Flight) -> Flight:
+        """Create or update a flight node; returns the input model."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(
+                    self._queries._Q_CREATE, props=flight.model_dump()
+                )
+                await result.consume()
+                return flight
+            except Neo4jError as e:
+                raise QueryError(f"Failed to create flight: {e}") from e
+
+    async def find_by_id(self, flight_id: str) -> Optional[Flight]:
+        """Return the flight with the given id, or ``None``."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(
+                    self._queries._Q_FIND_BY_ID, flight_id=flight_id
+                )
+                record = await result.single(strict=False)
+                if record is None:
+                    return None
+                return Flight(**dict(record["f"]))
+            except Neo4jError as e:
+                raise QueryError(f"Failed to find flight: {e}") from e
+
+    async def find_by_aircraft(self, aircraft_id: str) -> List[Flight]:
+        """Return the flights assigned to an aircraft."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(
+                    self._queries._Q_FIND_BY_AIRCRAFT, aircraft_id=aircraft_id
+                )
+                construct = Flight.model_construct
+                return [
+                    construct(**dict(record["f"])) async for record in result
+                ]
+            except Neo4jError as e:
+                raise QueryError(f"Failed to find flights: {e}") from e
+
+    async def find_all(self) -> List[Flight]:
+        """Return every flight in the database."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(self._queries._Q_FIND_ALL)
+                construct = Flight.model_construct
+                return [
+                    construct(**dict(record["f"])) async for record in result
+                ]
+            except Neo4jError as e:
+                raise QueryError(f"Failed to list flights: {e}") from e
+
+
+class AsyncSystemRepository:
+    """Async CRUD queries for :class:`System` nodes."""
+
+    _queries = SystemRepository
+
+    def __init__(self, connection: AsyncNeo4jConnection) -> None:
+        self.connection = connection
+
+    async def find_by_id(self, system_id: str) -> Optional[System]:
+        """Return the system with the given id, or ``None``."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(
+                    self._queries._Q_FIND_BY_ID, system_id=system_id
+                )
+                record = await result.single(strict=False)
+                if record is None:
+                    return None
+                return System(**dict(record["s"]))
+            except Neo4jError as e:
+                raise QueryError(f"Failed to find system: {e}") from e
+
+    async def find_by_aircraft(self, aircraft_id: str) -> List[System]:
+        """Return the systems installed on an aircraft."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(
+                    self._queries._Q_FIND_BY_AIRCRAFT, aircraft_id=aircraft_id
+                )
+                construct = System.model_construct
+                return [
+                    construct(**dict(record["s"])) async for record in result
+                ]
+            except Neo4jError as e:
+                raise QueryError(f"Failed to find systems: {e}") from e
+
+    async def find_all(self) -> List[System]:
+        """Return every system in the database."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(self._queries._Q_FIND_ALL)
+                construct = System.model_construct
+                return [
+                    construct(**dict(record["s"])) async for record in result
+                ]
+            except Neo4jError as e:
+                raise QueryError(f"Failed to list systems: {e}") from e
+
+
+class AsyncMaintenanceEventRepository:
+    """Async CRUD queries for :class:`MaintenanceEvent` nodes."""
+
+    _queries = MaintenanceEventRepository
+
+    def __init__(self, connection: AsyncNeo4jConnection) -> None:
+        self.connection = connection
+
+    async def create(self, event: MaintenanceEvent) -> MaintenanceEvent:
+        """Create or update a maintenance event node; returns the input
+        model."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(
+                    self._queries._Q_CREATE, props=event.model_dump()
+                )
+                await result.consume()
+                return event
+            except Neo4jError as e:
+                raise QueryError(f"Failed to create maintenance event: {e}") from e
+
+    async def find_by_id(self, event_id: str) -> Optional[MaintenanceEvent]:
+        """Return the maintenance event with the given id, or ``None``."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(
+                    self._queries._Q_FIND_BY_ID, event_id=event_id
+                )
+                record = await result.single(strict=False)
+                if record is None:
+                    return None
+                return MaintenanceEvent(**dict(record["m"]))
+            except Neo4jError as e:
+                raise QueryError(f"Failed to find maintenance event: {e}") from e
+
+    async def find_by_aircraft(
+        self, aircraft_id: str
+    ) -> List[MaintenanceEvent]:
+        """Return an aircraft's maintenance events."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(
+                    self._queries._Q_FIND_BY_AIRCRAFT_BULK,
+                    aircraft_ids=[aircraft_id],
+                )
+                construct = MaintenanceEvent.model_construct
+                events: List[MaintenanceEvent] = []
+                async for record in result:
+                    events.extend(
+                        construct(**dict(node)) for node in record["events"]
+                    )
+                return events
+            except Neo4jError as e:
+                raise QueryError(f"Failed to find maintenance events: {e}") from e
+
+    async def find_all(self) -> List[MaintenanceEvent]:
+        """Return every maintenance event in the database."""
+        async with self.connection.get_session() as session:
+            try:
+                result = await session.run(self._queries._Q_FIND_ALL)
+                construct = MaintenanceEvent.model_construct
+                return [
+                    construct(**dict(record["m"])) async for record in result
+                ]
+            except Neo4jError as e:
+                raise QueryError(f"Failed to list maintenance events: {e}") from e
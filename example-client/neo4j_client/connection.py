@@ -0,0 +1,556 @@
+"""Connection management for the Neo4j aviation client."""
+
+import atexit
+import functools
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from neo4j import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    Driver,
+    GraphDatabase,
+    Record,
+    Result,
+    Session,
+    Transaction,
+)
+from neo4j.exceptions import AuthError, ConfigurationError, ServiceUnavailable
+from pydantic import BaseModel
+
+from .exceptions import ClientConnectionError
+
+# Shared empty parameter map; avoids allocating a fresh dict per query.
+_EMPTY_PARAMS: Dict[str, Any] = MappingProxyType({})
+
+# Serializes driver creation only; the per-query session path stays lock-free.
+_driver_lock = threading.Lock()
+
+# The optional native PackStream codec (pip install neo4j-aviation-client[rust])
+# moves Bolt record decoding out of Python bytecode; the driver picks it up
+# automatically when importable.
+try:
+    import neo4j_rust_ext  # noqa: F401
+
+    RUST_EXTENSIONS_AVAILABLE = True
+except ImportError:
+    RUST_EXTENSIONS_AVAILABLE = False
+
+
+class _NoCloseSessionProxy:
+    """Wraps a thread-cached session so ``with`` blocks don't tear it down.
+
+    Forwards everything to the underlying session but turns ``close()`` and
+    ``__exit__`` into no-ops; the owning :class:`Neo4jConnection` closes the
+    real session.
+    """
+
+    __slots__ = ("_session",)
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    def __enter__(self) -> "_NoCloseSessionProxy":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+class Neo4jConnection:
+    """Manages a Neo4j driver and hands out sessions.
+
+    Supports use as a context manager::
+
+        with Neo4jConnection(uri, username, password) as conn:
+            with conn.get_session() as session:
+                session.run("RETURN 1")
+    """
+
+    __slots__ = (
+        "uri",
+        "username",
+        "password",
+        "database",
+        "fetch_size",
+        "verbose_notifications",
+        "acquisition_timeout",
+        "max_lifetime",
+        "verify",
+        "_driver",
+        "_session_factory",
+        "_query_cache",
+        "_shared_session",
+        "_tls",
+        "_tls_sessions",
+        "_metrics",
+        "_pool_size",
+        "_resize_lock",
+    )
+
+    # Process-wide driver registry: key -> [driver, refcount]. Repeat
+    # connections to the same endpoint reuse one driver (and its pool)
+    # instead of paying a TCP+TLS+HELLO handshake per instance.
+    _driver_registry: Dict[tuple, list] = {}
+
+    def __init__(
+        self,
+        uri: str,
+        username: str,
+        password: str,
+        database: str = "neo4j",
+        fetch_size: int = 1000,
+        verbose_notifications: bool = False,
+        pool_size: int = 50,
+        acquisition_timeout: float = 60.0,
+        max_lifetime: int = 3600,
+        verify: bool = False,
+    ) -> None:
+        """Configure a connection.
+
+        ``pool_size``, ``acquisition_timeout``, and ``max_lifetime`` map to
+        the driver's ``max_connection_pool_size``,
+        ``connection_acquisition_timeout``, and ``max_connection_lifetime``;
+        size the pool to expected concurrency rather than relying on driver
+        defaults.
+
+        ``verify=True`` (or ``NEO4J_VERIFY_ON_CONNECT=1`` in the
+        environment) round-trips to the server during :meth:`connect`;
+        by default validation is deferred to the first query, saving one
+        Bolt round-trip per construction in short-lived scripts.
+
+        With ``NEO4J_ENABLE_ROUTING=1`` in the environment, direct
+        ``bolt://`` URIs are upgraded to the routing ``neo4j://`` scheme so
+        sessions opened with ``default_access_mode=READ_ACCESS`` can fan
+        out to cluster read replicas instead of pinning to one server.
+        """
+        if os.environ.get("NEO4J_ENABLE_ROUTING") == "1":
+            split = urlsplit(uri)
+            if split.scheme in ("bolt", "bolt+s", "bolt+ssc"):
+                uri = urlunsplit(
+                    (split.scheme.replace("bolt", "neo4j", 1),) + split[1:]
+                )
+        self.uri = uri
+        self.username = username
+        self.password = password
+        self.database = database
+        self.fetch_size = fetch_size
+        self.verbose_notifications = verbose_notifications
+        self._driver: Optional[Driver] = None
+        self._session_factory = None
+        self._query_cache: Dict[str, str] = {}
+        self._shared_session: Optional[Session] = None
+        self._tls = threading.local()
+        self._tls_sessions: List[Session] = []
+        self._metrics: Dict[str, int] = {"acquired": 0, "acquire_ns": 0}
+        self._pool_size: int = pool_size
+        self.acquisition_timeout = acquisition_timeout
+        self.max_lifetime = max_lifetime
+        self.verify = verify or os.environ.get("NEO4J_VERIFY_ON_CONNECT") == "1"
+        self._resize_lock = threading.Lock()
+
+    def connect(self, warmup: int = 0) -> None:
+        """Open the driver and verify connectivity.
+
+        When ``warmup`` is positive, pre-open that many Bolt connections in
+        parallel and return them to the pool, so the first concurrent
+        requests skip the socket/TLS handshake on the acquisition path.
+
+        Driver creation is double-check locked and registry-backed:
+        instances pointing at the same endpoint share one driver (and its
+        connection pool), so only the first connect() pays the handshake.
+        """
+        if self._driver is not None:
+            return
+        with _driver_lock:
+            if self._driver is not None:
+                return
+            key = self._driver_key()
+            entry = self._driver_registry.get(key)
+            if entry is None:
+                # Server notifications and driver telemetry add parsing and
+                # background network work on the hot path; keep them off
+                # unless explicitly requested for development.
+                driver_kwargs: Dict[str, Any] = {
+                    "telemetry_disabled": True,
+                    "keep_alive": True,
+                    "max_connection_pool_size": self._pool_size,
+                    "connection_acquisition_timeout": self.acquisition_timeout,
+                    "max_connection_lifetime": self.max_lifetime,
+                    "connection_timeout": 15.0,
+                }
+                if not self.verbose_notifications:
+                    driver_kwargs["notifications_min_severity"] = "OFF"
+                try:
+                    driver = GraphDatabase.driver(
+                        self.uri,
+                        auth=(self.username, self.password),
+                        **driver_kwargs,
+                    )
+                    if self.verify:
+                        driver.verify_connectivity()
+                except (ServiceUnavailable, AuthError, ConfigurationError) as e:
+                    raise ClientConnectionError(str(e)) from e
+                entry = [driver, 0]
+                self._driver_registry[key] = entry
+            entry[1] += 1
+            self._driver = entry[0]
+            # Pre-bind the constant kwargs once; the per-query path then
+            # pays a plain call instead of keyword binding per session.
+            self._session_factory = functools.partial(
+                self._driver.session,
+                database=self.database,
+                fetch_size=self.fetch_size,
+            )
+        if warmup > 0:
+            self._warm_pool(warmup)
+
+    def _driver_key(self) -> tuple:
+        """Registry key: instances differing in any of these need their own driver."""
+        return (
+            self.uri,
+            self.username,
+            self.password,
+            self.verbose_notifications,
+            self._pool_size,
+            self.acquisition_timeout,
+            self.max_lifetime,
+        )
+
+    def _warm_pool(self, count: int) -> None:
+        """Open and release ``count`` sessions concurrently to fill the pool."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _open_and_release(_: int) -> None:
+            # Sessions acquire their Bolt connection lazily, so run a no-op
+            # query to force the connect/TLS/HELLO exchange before release.
+            with self._session_factory() as session:
+                session.run("RETURN 1").consume()
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            list(executor.map(_open_and_release, range(count)))
+
+    def close(self) -> None:
+        """Close all cached sessions and the driver."""
+        if self._shared_session is not None:
+            self._shared_session.close()
+            self._shared_session = None
+        for session in self._tls_sessions:
+            if not session.closed():
+                session.close()
+        self._tls_sessions.clear()
+        self._tls = threading.local()
+        if self._driver:
+            with _driver_lock:
+                key = self._driver_key()
+                entry = self._driver_registry.get(key)
+                if entry is not None:
+                    entry[1] -= 1
+                    if entry[1] <= 0:
+                        entry[0].close()
+                        del self._driver_registry[key]
+                else:
+                    self._driver.close()
+            self._driver = None
+            self._session_factory = None
+
+    @classmethod
+    def shutdown_all(cls) -> None:
+        """Close every registry driver; registered to run at interpreter exit."""
+        with _driver_lock:
+            for driver, _ in cls._driver_registry.values():
+                driver.close()
+            cls._driver_registry.clear()
+
+    def get_session(self, **session_kwargs: Any) -> Session:
+        """Return a session bound to the configured database.
+
+        Plain calls lease one cached session per thread, wrapped so that
+        ``with``/``close()`` leave it open for reuse — this removes the
+        session allocation and pool-release churn of short per-query
+        sessions. Extra keyword arguments (``default_access_mode``,
+        ``bookmarks``, ``impersonated_user``, ...) bypass the cache and
+        return a fresh session the caller owns and must close.
+        """
+        if not self._driver:
+            raise ClientConnectionError("Not connected. Call connect() first.")
+        if session_kwargs:
+            session_kwargs.setdefault("fetch_size", self.fetch_size)
+            started = time.perf_counter_ns()
+            session = self._driver.session(database=self.database, **session_kwargs)
+            self._metrics["acquired"] += 1
+            self._metrics["acquire_ns"] += time.perf_counter_ns() - started
+            return session
+        session = getattr(self._tls, "session", None)
+        if session is None or session.closed():
+            started = time.perf_counter_ns()
+            session = self._session_factory()
+            self._metrics["acquired"] += 1
+            self._metrics["acquire_ns"] += time.perf_counter_ns() - started
+            self._tls.session = session
+            self._tls_sessions.append(session)
+        return _NoCloseSessionProxy(session)
+
+    def read_session(self, **session_kwargs: Any) -> Session:
+        """Return a session hinted for read routing on a cluster."""
+        return self.get_session(
+            default_access_mode=READ_ACCESS, **session_kwargs
+        )
+
+    def write_session(self, **session_kwargs: Any) -> Session:
+        """Return a session routed to the cluster leader for writes."""
+        return self.get_session(
+            default_access_mode=WRITE_ACCESS, **session_kwargs
+        )
+
+    @property
+    def driver(self) -> Driver:
+        """The underlying shared :class:`neo4j.Driver`.
+
+        One driver is kept per distinct connection target (see the
+        registry in :meth:`connect`) and repositories never hold sessions
+        of their own — they borrow one per call. Exposed for callers that
+        need driver-level APIs directly, e.g. ``driver.session(...)`` with
+        bespoke configuration.
+        """
+        if not self._driver:
+            raise ClientConnectionError("Not connected. Call connect() first.")
+        return self._driver
+
+    @property
+    def shared_session(self) -> Session:
+        """A lazily created, long-lived session reused across calls.
+
+        Unlike :meth:`get_session`, which acquires a Bolt connection from the
+        pool on every call, this session is created once and reused, which
+        avoids one pool acquisition per query in tight loops. It is closed by
+        :meth:`close`.
+        """
+        if self._shared_session is None:
+            if not self._driver:
+                raise ClientConnectionError("Not connected. Call connect() first.")
+            self._shared_session = self._session_factory()
+        return self._shared_session
+
+    def scoped_session(self) -> Session:
+        """Return the calling thread's cached session.
+
+        Alias for plain :meth:`get_session`, named for call sites that want
+        to make the reuse explicit: repository methods running on the same
+        thread all share this session rather than paying session setup and
+        teardown per query.
+        """
+        return self.get_session()
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[Transaction]:
+        """Run a block of statements inside one explicit transaction.
+
+        Yields a :class:`neo4j.Transaction`; every ``tx.run`` inside the
+        block shares a single Bolt connection and commit, so a batch of
+        writes pays one transaction overhead instead of one per statement.
+        Commits on success, rolls back if the block raises.
+        """
+        with self.get_session(fetch_size=self.fetch_size) as session:
+            tx = session.begin_transaction()
+            try:
+                yield tx
+                tx.commit()
+            except Exception:
+                tx.rollback()
+                raise
+
+    def release_thread_session(self) -> None:
+        """Close and drop the calling thread's cached session.
+
+        Call from request-teardown hooks in threaded servers so worker
+        threads return their Bolt connection to the pool between requests.
+        """
+        session = getattr(self._tls, "session", None)
+        if session is None:
+            return
+        del self._tls.session
+        try:
+            self._tls_sessions.remove(session)
+        except ValueError:
+            pass
+        if not session.closed():
+            session.close()
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Session-acquisition counters: ``acquired`` and total ``acquire_ns``.
+
+        ``acquire_ns / acquired`` climbing over time is the signature of an
+        under-sized pool; feed it to :meth:`resize_pool`.
+        """
+        return dict(self._metrics)
+
+    def resize_pool(self, new_size: int) -> None:
+        """Re-open the driver with a new maximum connection pool size.
+
+        Intended as a hook for an external controller watching
+        :attr:`metrics`. Closes all cached sessions and the current driver
+        before reconnecting, serialized behind a lock.
+        """
+        with self._resize_lock:
+            # close() looks the driver up by _driver_key(), which includes
+            # _pool_size — resize only after releasing the old entry, or
+            # the lookup misses and a driver other connections share gets
+            # closed underneath them.
+            self.close()
+            self._pool_size = new_size
+            self.connect()
+
+    def _intern(self, cypher: str) -> str:
+        """Return an interned copy of a Cypher string, cached per connection.
+
+        Repository queries re-send identical Cypher text on every call;
+        interning makes repeated runs reuse one string object, so per-call
+        hashing and encoding hit warm caches.
+        """
+        return self._query_cache.setdefault(cypher, sys.intern(cypher))
+
+    def run(
+        self, cypher: str, params: Optional[Dict[str, Any]] = None
+    ) -> Result:
+        """Run a query on the shared session with the interned Cypher text."""
+        return self.shared_session.run(self._intern(cypher), params or _EMPTY_PARAMS)
+
+    def scalar(
+        self, cypher: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Record]:
+        """Run a single-row query with streaming disabled.
+
+        ``fetch_size=-1`` tells the driver to pull everything in one batch,
+        so aggregates and lookups known to return one row avoid the PULL
+        batching machinery entirely.
+        """
+        with self.get_session(fetch_size=-1) as session:
+            return session.run(self._intern(cypher), params or _EMPTY_PARAMS).single()
+
+    def bulk_iter(
+        self, cypher: str, params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Record]:
+        """Stream a bulk-export query with a large (10k) fetch size."""
+        return self.iter_query(cypher, params, fetch_size=10_000)
+
+    def run_read(
+        self, cypher: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Record]:
+        """Run one read in a managed, read-routed transaction.
+
+        A one-call counterpart to the repositories' ``execute_read``
+        closures for ad-hoc queries: the driver's retry policy applies,
+        the session is hinted for follower routing, and the materialized
+        records come back.
+        """
+
+        def work(tx):
+            return list(tx.run(self._intern(cypher), params or _EMPTY_PARAMS))
+
+        with self.read_session() as session:
+            return session.execute_read(work)
+
+    def run_write(
+        self, cypher: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Record]:
+        """Run one write in a managed transaction on the cached
+        thread-local session; see :meth:`run_read`."""
+
+        def work(tx):
+            return list(tx.run(self._intern(cypher), params or _EMPTY_PARAMS))
+
+        with self.get_session() as session:
+            return session.execute_write(work)
+
+    def run_as(
+        self,
+        cypher: str,
+        model: type,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[BaseModel]:
+        """Run a query and map each record straight into ``model`` instances.
+
+        Uses ``model_construct`` to skip Pydantic validation: the values
+        arrive already typed from the database, so re-validating every
+        record is redundant work. Only use this with queries whose RETURN
+        shape matches the model's fields.
+        """
+        with self.get_session() as session:
+            result = session.run(self._intern(cypher), params or _EMPTY_PARAMS)
+            return [model.model_construct(**record.data()) for record in result]
+
+    def iter_query(
+        self,
+        cypher: str,
+        params: Optional[Dict[str, Any]] = None,
+        fetch_size: int = 1000,
+    ) -> Iterator[Record]:
+        """Stream a query's records instead of materializing the result.
+
+        Yields records as the driver pulls them in ``fetch_size`` batches,
+        so peak memory is bounded by one batch regardless of how many
+        records the query returns. The session lives for the duration of
+        the iteration and closes when the generator is exhausted.
+        """
+        if not self._driver:
+            raise ClientConnectionError("Not connected. Call connect() first.")
+        with self._driver.session(
+            database=self.database, fetch_size=fetch_size
+        ) as session:
+            result = session.run(cypher, params or {})
+            for record in result:
+                yield record
+
+    def execute_batch(
+        self,
+        statements: List[Tuple[str, Dict[str, Any]]],
+        batch_size: int = 100,
+        read_only: bool = False,
+    ) -> List[list]:
+        """Run many Cypher statements, pipelined in batched transactions.
+
+        Each batch of ``batch_size`` ``(cypher, parameters)`` pairs executes
+        inside a single managed transaction on one Bolt connection, so the
+        client pays one round-trip per batch instead of one per statement.
+        Returns the materialized records of every statement, in order.
+        """
+        if not self._driver:
+            raise ClientConnectionError("Not connected. Call connect() first.")
+
+        results: List[list] = []
+        with self._driver.session(database=self.database) as session:
+            for start in range(0, len(statements), batch_size):
+                chunk = statements[start : start + batch_size]
+
+                def _run_chunk(tx, chunk=chunk):
+                    return [list(tx.run(query, params)) for query, params in chunk]
+
+                if read_only:
+                    results.extend(session.execute_read(_run_chunk))
+                else:
+                    results.extend(session.execute_write(_run_chunk))
+        return results
+
+    def __enter__(self) -> "Neo4jConnection":
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+atexit.register(Neo4jConnection.shutdown_all)
@@ -0,0 +1,28 @@
+"""Custom exceptions for the Neo4j aviation client."""
+
+
+class Neo4jClientError(Exception):
+    """Base exception for all client errors."""
+
+
+class ClientConnectionError(Neo4jClientError):
+    """Raised when a connection to Neo4j cannot be established or is missing."""
+
+
+class QueryError(Neo4jClientError):
+    """Raised when a Cypher query fails to execute."""
+
+
+class NotFoundError(Neo4jClientError):
+    """Raised when a requested entity does not exist."""
+
+
+class ValidationError(Neo4jClientError):
+    """Raised when data fails model validation before a query."""
+
+
+# Deprecated alias matching the original generator spec. Deliberately not
+# re-exported from the package: it shadows the ConnectionError builtin in
+# any module that imports it, costing an extra global lookup on every raise
+# and masking the builtin for unrelated code.
+ConnectionError = ClientConnectionError
@@ -0,0 +1,210 @@
+"""Pydantic models for the aviation graph entities.
+
+One model per Neo4j node label, mirroring the schema documented in
+``DATA_MODEL.md``.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from neo4j.time import Date as _Neo4jDate
+from neo4j.time import DateTime as _Neo4jDateTime
+from pydantic import BaseModel, ConfigDict, field_validator
+
+__all__ = [
+    "GraphModel",
+    "Aircraft",
+    "Airport",
+    "Flight",
+    "System",
+    "Component",
+    "Sensor",
+    "Reading",
+    "MaintenanceEvent",
+    "Delay",
+    "readings_to_arrow",
+]
+
+
+class GraphModel(BaseModel):
+    """Base class applying shared performance-oriented configuration.
+
+    Instances are frozen (hashable, safely shareable across threads),
+    ignore unexpected properties coming back from the database, and skip
+    assignment re-validation, keeping pydantic-core's compiled validator on
+    the fast path for bulk row hydration.
+    """
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        validate_assignment=False,
+        from_attributes=True,
+        # Don't build the core schema at class-creation time; the warmup
+        # loop at the bottom of this module is the single build point.
+        defer_build=True,
+    )
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def _coerce_neo4j_temporals(cls, value):
+        """Convert driver temporal values to stdlib types before validation.
+
+        Temporal properties come back from Bolt as
+        :class:`neo4j.time.DateTime`/:class:`neo4j.time.Date`, which
+        pydantic does not recognise; ``to_native()`` turns them into the
+        stdlib types the annotations declare. ISO strings keep coercing
+        through pydantic as before.
+        """
+        if isinstance(value, (_Neo4jDateTime, _Neo4jDate)):
+            return value.to_native()
+        return value
+
+    @classmethod
+    def from_neo4j_record(cls, node) -> "GraphModel":
+        """Build a model from a Neo4j node/mapping without validation.
+
+        Values coming back from the database were typed by the server, so
+        re-running field validation per record is redundant;
+        ``model_construct`` binds fields directly. Only use this with data
+        read from Neo4j — unvalidated external input must go through the
+        normal constructor.
+        """
+        return cls.model_construct(**dict(node))
+
+
+class Aircraft(GraphModel):
+    """An aircraft in the fleet."""
+
+    aircraft_id: str
+    tail_number: Optional[str] = None
+    icao24: Optional[str] = None
+    model: Optional[str] = None
+    operator: Optional[str] = None
+    manufacturer: Optional[str] = None
+
+
+class Airport(GraphModel):
+    """An airport served by the fleet."""
+
+    airport_id: str
+    iata: Optional[str] = None
+    icao: Optional[str] = None
+    name: Optional[str] = None
+    city: Optional[str] = None
+    country: Optional[str] = None
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
+
+class Flight(GraphModel):
+    """A scheduled flight operated by an aircraft."""
+
+    flight_id: str
+    flight_number: Optional[str] = None
+    aircraft_id: Optional[str] = None
+    operator: Optional[str] = None
+    origin: Optional[str] = None
+    destination: Optional[str] = None
+    scheduled_departure: Optional[datetime] = None
+    scheduled_arrival: Optional[datetime] = None
+
+
+class System(GraphModel):
+    """An on-board system installed on an aircraft."""
+
+    system_id: str
+    aircraft_id: Optional[str] = None
+    name: Optional[str] = None
+    type: Optional[str] = None
+
+
+class Component(GraphModel):
+    """A component belonging to a system."""
+
+    component_id: str
+    system_id: Optional[str] = None
+    name: Optional[str] = None
+    type: Optional[str] = None
+
+
+class Sensor(GraphModel):
+    """A sensor attached to a system."""
+
+    sensor_id: str
+    system_id: Optional[str] = None
+    name: Optional[str] = None
+    type: Optional[str] = None
+    unit: Optional[str] = None
+
+
+class Reading(GraphModel):
+    """A timestamped measurement produced by a sensor.
+
+    ``timestamp`` is a real :class:`~datetime.datetime` rather than an ISO
+    string, so analytics consumers avoid a per-row string parse; Pydantic
+    still coerces ISO-formatted strings on input for backward
+    compatibility.
+    """
+
+    reading_id: str
+    sensor_id: Optional[str] = None
+    timestamp: Optional[datetime] = None
+    value: Optional[float] = None
+
+
+class MaintenanceEvent(GraphModel):
+    """A maintenance event affecting an aircraft, system, or component."""
+
+    event_id: str
+    aircraft_id: Optional[str] = None
+    system_id: Optional[str] = None
+    component_id: Optional[str] = None
+    fault: Optional[str] = None
+    severity: Optional[str] = None
+    reported_at: Optional[datetime] = None
+    corrective_action: Optional[str] = None
+
+
+class Delay(GraphModel):
+    """A delay recorded against a flight."""
+
+    delay_id: str
+    flight_id: Optional[str] = None
+    cause: Optional[str] = None
+    minutes: Optional[int] = None
+
+
+def readings_to_arrow(session, cypher: str, **params):
+    """Run a query and return the result as a columnar ``pyarrow.Table``.
+
+    Bulk analytics over :class:`Reading` streams should not build one
+    Python object per row; ``Result.to_df()`` hands the rows to pandas in
+    bulk and Arrow stores them as contiguous typed columns, so downstream
+    aggregation runs in native kernels instead of Python attribute loops.
+
+    Requires the ``analytics`` extra (``pandas`` and ``pyarrow``).
+    """
+    import pyarrow as pa
+
+    df = session.run(cypher, **params).to_df()
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+# Compile validators and JSON schemas eagerly so the first request that
+# serializes these shapes (e.g. an MCP tool description) doesn't pay the
+# one-off pydantic-core compilation stall.
+for _model in (
+    Aircraft,
+    Airport,
+    Flight,
+    System,
+    Component,
+    Sensor,
+    Reading,
+    MaintenanceEvent,
+    Delay,
+):
+    _model.model_rebuild(force=True)
+    _model.model_json_schema()
+del _model
@@ -0,0 +1,1799 @@
+"""Repository classes for querying the aviation graph.
+
+One repository per entity type, each taking a :class:`Neo4jConnection` and
+issuing parameterized Cypher queries. Queries run as managed transaction
+functions — ``session.execute_read`` for finders, ``session.execute_write``
+for mutations — so the driver applies its built-in retry and bookmark
+machinery (transient failures such as a cluster leader switch are retried
+with backoff instead of surfacing) and can reuse one connection across
+calls on the same session.
+"""
+
+import functools
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from neo4j.exceptions import Neo4jError
+from pydantic import TypeAdapter
+
+from .connection import Neo4jConnection
+from .exceptions import QueryError
+from .models import (
+    Aircraft,
+    Airport,
+    Component,
+    Delay,
+    Flight,
+    MaintenanceEvent,
+    Reading,
+    Sensor,
+    System,
+)
+from .rows import (
+    AircraftRow,
+    AirportRow,
+    FlightRow,
+    MaintenanceEventRow,
+    row_from_dict,
+)
+
+
+def wrap_query_error(message: str):
+    """Translate driver errors into :class:`QueryError` with a fixed prefix.
+
+    One decorator replaces the per-method ``try/except Exception`` blocks:
+    it catches :class:`~neo4j.exceptions.Neo4jError` specifically, so
+    ``KeyboardInterrupt``, ``MemoryError``, and programming bugs propagate
+    untouched instead of being reworded as query failures, and the driver's
+    own retryable errors keep their type until this boundary.
+    """
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Neo4jError as e:
+                raise QueryError(f"{message}: {e}") from e
+
+        return wrapper
+
+    return decorate
+
+
+# One TypeAdapter per model, instantiated once at import: validating a whole
+# list in a single validate_python call keeps the per-row loop inside
+# pydantic-core's Rust iterator instead of Python.
+_LIST_ADAPTERS = {
+    model: TypeAdapter(List[model])
+    for model in (
+        Aircraft,
+        Airport,
+        Component,
+        Delay,
+        Flight,
+        MaintenanceEvent,
+        Reading,
+        Sensor,
+        System,
+    )
+}
+
+
+def rows_from_json(model, payload) -> list:
+    """Validate a JSON array of rows straight from bytes.
+
+    For transports that hand back raw JSON (e.g. Neo4j's HTTP query API),
+    ``validate_json`` parses and validates in a single pydantic-core pass,
+    skipping the ``json.loads`` dict intermediate entirely. Bolt-based
+    paths keep using the record helpers below.
+    """
+    return _LIST_ADAPTERS[model].validate_json(payload)
+
+
+def _validated_rows(model, result, key: str) -> list:
+    """Materialize and validate a result column in one bulk adapter call.
+
+    Used on ``find_all``-style boundary queries where validated output is
+    wanted; the projected column is already a list of plain dicts, so it
+    feeds the pre-bound list adapter directly and the whole batch is
+    validated in Rust with no Python-level per-row work at all.
+    Traversal and bulk-internal paths use :func:`_rows`/:func:`_items`
+    instead, which skip validation entirely via ``model_construct``;
+    single-record ``create``/``update`` results keep the validating
+    constructor as defence in depth on the write path.
+    """
+    return _LIST_ADAPTERS[model].validate_python(result.value(key))
+
+
+def _rows(model, result, key: str) -> list:
+    """Materialize a result column into models without re-validation.
+
+    The driver already returns typed values, so hydrating via
+    ``model_construct`` skips Pydantic validation in the per-row loop —
+    the dominant CPU cost on large result sets. Column extraction goes
+    through ``Result.value(key)``, which yields the projected maps —
+    already plain dicts, so no per-row copy — and skips one ``Record``
+    wrapper allocation per row; the constructor is pre-bound so the loop
+    body carries no repeated attribute lookups.
+    Single-object paths keep the validated constructor, where the
+    difference doesn't matter.
+    """
+    construct = model.model_construct
+    return [construct(**node) for node in result.value(key)]
+
+
+def _items(model, nodes) -> list:
+    """Materialize a collected node list into models without re-validation."""
+    construct = model.model_construct
+    return [construct(**node) for node in nodes]
+
+
+@functools.lru_cache(maxsize=None)
+def _fields_of(model) -> tuple:
+    """Cache a model's field-name tuple for hot row-shaping loops."""
+    return tuple(model.model_fields)
+
+
+def _params_of(instance) -> dict:
+    """Build a query parameter dict straight from model attributes.
+
+    ``model_dump`` walks the model through pydantic's serializer on every
+    call; these flat models need one attribute read per field, so a
+    comprehension over the cached field tuple produces the same dict
+    without that machinery. Noticeable on write paths driven in loops.
+    """
+    return {k: getattr(instance, k) for k in _fields_of(type(instance))}
+
+
+# Rows per UNWIND transaction on the batch write paths. Very large payloads
+# inflate server transaction memory and commit latency; around a thousand
+# rows keeps each commit cheap while still collapsing round-trips.
+_BATCH_SIZE = 1000
+
+
+def _chunked(rows: list, size: int = _BATCH_SIZE) -> Iterator[list]:
+    """Yield successive fixed-size slices of a row list."""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _projection(model, alias: str) -> str:
+    """Render a Cypher map projection over the model's declared fields.
+
+    ``RETURN a`` serializes every node property over Bolt even when the
+    caller consumes only the model's fields; ``a { .aircraft_id, ... }``
+    emits exactly the record shape the hydration code wants. Built from
+    ``model_fields`` at class-definition time, so adding a model field
+    automatically widens the projection.
+    """
+    projected = ", ".join(f".{name}" for name in _fields_of(model))
+    return f"{alias} {{{projected}}}"
+
+
+class _BaseRepository:
+    """Shared plumbing for the hand-written repositories.
+
+    The single-record and list query shapes repeat across all five
+    classes; funneling them through :meth:`_one` and :meth:`_many` keeps
+    the cross-cutting choices — managed-transaction execution, lenient
+    ``single()``, hydration strategy — in one place, so a future
+    optimization (tracing, metrics, caching) lands once instead of five
+    times. Methods with bespoke shapes keep their own bodies.
+    """
+
+    def __init__(self, connection: Neo4jConnection) -> None:
+        self.connection = connection
+
+    def _one(self, model, query: str, key: str, **params):
+        """Run a single-record read, validating the one row at the boundary."""
+
+        def work(tx):
+            record = tx.run(query, params).single(strict=False)
+            if record is None:
+                return None
+            return model(**record[key])
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    def _many(self, model, query: str, key: str, **params) -> list:
+        """Run a list read, hydrating rows via ``model_construct``."""
+
+        def work(tx):
+            return _rows(model, tx.run(query, params), key)
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    def _bulk_load(
+        self, query: str, rows: list, batch_size: int, parallel: bool
+    ) -> int:
+        """Run an ``apoc.periodic.iterate`` load and return rows processed.
+
+        APOC drives its own inner transactions, so the call runs on an
+        auto-commit session rather than inside ``execute_write`` — a
+        managed outer transaction would hold the whole load open and
+        defeat the batched commits.
+        """
+        with self.connection.get_session() as session:
+            record = session.run(
+                query, rows=rows, batch_size=batch_size, parallel=parallel
+            ).single()
+            if record["errorMessages"]:
+                raise QueryError(f"Bulk load failed: {record['errorMessages']}")
+            return record["total"]
+
+
+@dataclass(slots=True, frozen=True)
+class AircraftBundle:
+    """Everything an aircraft detail view needs, loaded in one query."""
+
+    aircraft: Aircraft
+    flights: List[Flight]
+    systems: List[System]
+    events: List[MaintenanceEvent]
+
+
+class AircraftRepository(_BaseRepository):
+    """CRUD and traversal queries for :class:`Aircraft` nodes."""
+
+    _Q_CREATE = (
+        "MERGE (a:Aircraft {aircraft_id: $props.aircraft_id}) "
+        "SET a += $props"
+    )
+    _Q_CREATE_MANY = (
+        "UNWIND $rows AS row "
+        "MERGE (a:Aircraft {aircraft_id: row.aircraft_id}) "
+        "SET a += row "
+        f"RETURN {_projection(Aircraft, 'a')} AS a"
+    )
+    _Q_BULK_LOAD = (
+        "CALL apoc.periodic.iterate("
+        "'UNWIND $rows AS row RETURN row', "
+        "'MERGE (a:Aircraft {aircraft_id: row.aircraft_id}) SET a += row', "
+        "{batchSize: $batch_size, parallel: $parallel, "
+        "params: {rows: $rows}}) "
+        "YIELD total, errorMessages RETURN total, errorMessages"
+    )
+    _Q_FIND_BY_ID = (
+        "MATCH (a:Aircraft {aircraft_id: $aircraft_id}) "
+        f"RETURN {_projection(Aircraft, 'a')} AS a"
+    )
+    _Q_FIND_BY_IDS = (
+        "MATCH (a:Aircraft) WHERE a.aircraft_id IN $ids "
+        f"RETURN {_projection(Aircraft, 'a')} AS a"
+    )
+    _Q_FIND_BY_TAIL_NUMBER = (
+        "MATCH (a:Aircraft {tail_number: $tail_number}) "
+        f"RETURN {_projection(Aircraft, 'a')} AS a"
+    )
+    _Q_FIND_ALL = (
+        "MATCH (a:Aircraft) "
+        f"RETURN {_projection(Aircraft, 'a')} AS a ORDER BY a.aircraft_id"
+    )
+    _Q_ITER_ALL = _Q_FIND_ALL
+    _Q_FIND_ALL_LIMIT = _Q_FIND_ALL + " LIMIT $limit"
+    _Q_UPDATE = (
+        "MATCH (a:Aircraft {aircraft_id: $props.aircraft_id}) "
+        "SET a += $props "
+        "RETURN a.aircraft_id AS id"
+    )
+    _Q_DELETE = "MATCH (a:Aircraft {aircraft_id: $aircraft_id}) DETACH DELETE a"
+    _Q_GET_SYSTEMS = (
+        "MATCH (a:Aircraft {aircraft_id: $aircraft_id})-[:HAS_SYSTEM]->(s:System) "
+        f"RETURN {_projection(System, 's')} AS s ORDER BY s.system_id"
+    )
+    _Q_GET_FLIGHTS = (
+        "MATCH (a:Aircraft {aircraft_id: $aircraft_id})-[:OPERATES_FLIGHT]->(f:Flight) "
+        f"RETURN {_projection(Flight, 'f')} AS f ORDER BY f.scheduled_departure"
+    )
+    _Q_GET_MAINTENANCE_EVENTS = (
+        "MATCH (m:MaintenanceEvent)-[:AFFECTS_AIRCRAFT]->"
+        "(a:Aircraft {aircraft_id: $aircraft_id}) "
+        f"RETURN {_projection(MaintenanceEvent, 'm')} AS m ORDER BY m.reported_at"
+    )
+    _Q_GET_COMPONENTS_BULK = (
+        "MATCH (a:Aircraft) WHERE a.aircraft_id IN $aircraft_ids "
+        "MATCH (a)-[:HAS_SYSTEM]->(:System)-[:HAS_COMPONENT]->(c:Component) "
+        "RETURN a.aircraft_id AS aircraft_id, "
+        f"collect({_projection(Component, 'c')}) AS components"
+    )
+    _Q_FIND_MISSING_COMPONENTS = (
+        "MATCH (a:Aircraft {aircraft_id: $aircraft_id})-[:HAS_SYSTEM]->"
+        "(:System)-[:HAS_COMPONENT]->(c:Component)-[:HAS_EVENT]->"
+        "(m:MaintenanceEvent) "
+        "WHERE m.corrective_action IS NULL "
+        f"RETURN DISTINCT {_projection(Component, 'c')} AS c "
+        "ORDER BY c.component_id"
+    )
+    # Each fan-out is aggregated before the next OPTIONAL MATCH, so the
+    # row stream never holds more than one relation's rows at a time;
+    # stacking the matches instead would materialize the flights x
+    # systems x events cross product before any collect. Ordering before
+    # each collect keeps the capped slices deterministic.
+    _Q_FIND_BUNDLE = (
+        "MATCH (a:Aircraft {aircraft_id: $aircraft_id}) "
+        "OPTIONAL MATCH (a)-[:OPERATES_FLIGHT]->(f:Flight) "
+        "WITH a, f ORDER BY f.scheduled_departure "
+        f"WITH a, collect({_projection(Flight, 'f')})[..$flight_limit] "
+        "AS flights "
+        "OPTIONAL MATCH (a)-[:HAS_SYSTEM]->(s:System) "
+        "WITH a, flights, s ORDER BY s.system_id "
+        f"WITH a, flights, collect({_projection(System, 's')}) AS systems "
+        "OPTIONAL MATCH (a)<-[:AFFECTS_AIRCRAFT]-(m:MaintenanceEvent) "
+        "WITH a, flights, systems, m ORDER BY m.reported_at "
+        f"RETURN {_projection(Aircraft, 'a')} AS a, flights, systems, "
+        f"collect({_projection(MaintenanceEvent, 'm')})"
+        "[..$event_limit] AS events"
+    )
+    _Q_FIND_LATEST_DESTINATIONS = (
+        "MATCH (a:Aircraft {aircraft_id: $aircraft_id})-[:OPERATES_FLIGHT]->(f:Flight) "
+        "RETURN f.flight_number AS flight_number, f.destination AS destination, "
+        "f.scheduled_departure AS scheduled_departure "
+        "ORDER BY f.scheduled_departure DESC LIMIT $limit"
+    )
+
+    _INDEXES = (
+        "CREATE CONSTRAINT aircraft_id_unique IF NOT EXISTS "
+        "FOR (a:Aircraft) REQUIRE a.aircraft_id IS UNIQUE",
+        "CREATE INDEX aircraft_tail_number_idx IF NOT EXISTS "
+        "FOR (a:Aircraft) ON (a.tail_number)",
+        "CREATE INDEX aircraft_operator_idx IF NOT EXISTS "
+        "FOR (a:Aircraft) ON (a.operator)",
+    )
+
+    # Aircraft records change more often than airports or systems, so the
+    # point-lookup cache keeps entries briefly; writes through this
+    # repository invalidate eagerly.
+    _CACHE_TTL = 30.0
+    _CACHE_MAX = 4096
+
+    def __init__(self, connection: Neo4jConnection) -> None:
+        super().__init__(connection)
+        self._cache: Dict[tuple, tuple] = {}
+
+    def _cache_get(self, key: tuple):
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _cache_put(self, key: tuple, value) -> None:
+        if len(self._cache) >= self._CACHE_MAX:
+            self._cache.clear()
+        self._cache[key] = (time.monotonic() + self._CACHE_TTL, value)
+
+    def invalidate(self, aircraft_id: Optional[str] = None) -> None:
+        """Drop cached entries for one aircraft, or the whole cache."""
+        if aircraft_id is None:
+            self._cache.clear()
+            return
+        self._cache.pop(("by_id", aircraft_id), None)
+        for key, entry in list(self._cache.items()):
+            if entry[1].aircraft_id == aircraft_id:
+                del self._cache[key]
+
+    @classmethod
+    def ensure_indexes(cls, connection: Neo4jConnection) -> None:
+        """Create the indexes and constraints this repository depends on.
+
+        Property matches are label scans without an index; running the
+        repository's idempotent CREATE ... IF NOT EXISTS statements once
+        at startup turns them into index seeks, and the uniqueness
+        constraint on the identity property doubles as its backing index.
+        Cheap when the schema already exists.
+        """
+        with connection.unit_of_work() as tx:
+            for statement in cls._INDEXES:
+                tx.run(statement)
+
+    @wrap_query_error("Failed to create aircraft")
+    def create(self, aircraft: Aircraft) -> Aircraft:
+        """Create or update an aircraft node.
+
+        Ingesting a batch? Use :meth:`create_many`, which merges the whole
+        list in one statement and one commit.
+
+        Returns the input model: after the MERGE the stored state equals
+        it, so nothing is RETURNed and ``consume()`` just drains the
+        result summary.
+        """
+        query = self._Q_CREATE
+
+        def work(tx):
+            tx.run(query, props=_params_of(aircraft)).consume()
+
+        with self.connection.get_session() as session:
+            session.execute_write(work)
+        self.invalidate(aircraft.aircraft_id)
+        return aircraft
+
+    @wrap_query_error("Failed to create aircraft")
+    def create_many(self, aircraft: List[Aircraft]) -> List[Aircraft]:
+        """Create or update many aircraft in a single UNWIND statement.
+
+        A loop of :meth:`create` calls pays one round-trip and one commit
+        per aircraft; binding the batch as ``$rows`` turns M writes into
+        one query per :data:`_BATCH_SIZE` rows.
+        """
+        rows = [_params_of(a) for a in aircraft]
+
+        def work(tx, batch):
+            return _rows(Aircraft, tx.run(self._Q_CREATE_MANY, rows=batch), "a")
+
+        created: List[Aircraft] = []
+        with self.connection.get_session() as session:
+            for batch in _chunked(rows):
+                created.extend(session.execute_write(work, batch))
+        self.invalidate()
+        return created
+
+    @wrap_query_error("Failed to bulk load aircraft")
+    def bulk_load(
+        self,
+        aircraft: List[Aircraft],
+        batch_size: int = 10000,
+        parallel: bool = False,
+    ) -> int:
+        """Merge a very large aircraft batch with ``apoc.periodic.iterate``.
+
+        :meth:`create_many` still holds each chunk in one client-driven
+        transaction; for six-figure row counts APOC commits server-side
+        every ``batch_size`` rows, keeping transaction state bounded with
+        no per-chunk round-trips. Requires the APOC plugin.
+        ``parallel=True`` is safe only when rows touch disjoint nodes
+        (distinct aircraft ids). Returns the number of rows processed.
+        """
+        rows = [_params_of(a) for a in aircraft]
+        return self._bulk_load(self._Q_BULK_LOAD, rows, batch_size, parallel)
+
+    @wrap_query_error("Failed to find aircraft")
+    def find_by_id(self, aircraft_id: str) -> Optional[Aircraft]:
+        """Return the aircraft with the given id, or ``None``.
+
+        Hits are served from a short-lived in-process cache; the returned
+        models are frozen, so sharing one instance across callers is safe.
+        Looking up many aircraft in a loop? Use :meth:`find_by_ids`,
+        which fetches them all in one round-trip.
+        """
+        cached = self._cache_get(("by_id", aircraft_id))
+        if cached is not None:
+            return cached
+        aircraft = self._one(
+            Aircraft, self._Q_FIND_BY_ID, "a", aircraft_id=aircraft_id
+        )
+        if aircraft is None:
+            return None
+        self._cache_put(("by_id", aircraft_id), aircraft)
+        return aircraft
+
+    @wrap_query_error("Failed to find aircraft")
+    def find_by_ids(self, ids: List[str]) -> Dict[str, Aircraft]:
+        """Fetch many aircraft in one round-trip, keyed by aircraft_id.
+
+        Callers looping find_by_id over a list pay one network round-trip
+        per id; this issues a single IN-list query instead.
+        """
+        query = self._Q_FIND_BY_IDS
+
+        def work(tx):
+            construct = Aircraft.model_construct
+            nodes = tx.run(query, ids=ids).value("a")
+            return {
+                node["aircraft_id"]: construct(**node) for node in nodes
+            }
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to find aircraft")
+    def find_by_tail_number(self, tail_number: str) -> Optional[Aircraft]:
+        """Return the aircraft with the given tail number, or ``None``.
+
+        Hits are served from the same short-lived cache as
+        :meth:`find_by_id`.
+        """
+        cached = self._cache_get(("by_tail", tail_number))
+        if cached is not None:
+            return cached
+        aircraft = self._one(
+            Aircraft, self._Q_FIND_BY_TAIL_NUMBER, "a", tail_number=tail_number
+        )
+        if aircraft is None:
+            return None
+        self._cache_put(("by_tail", tail_number), aircraft)
+        return aircraft
+
+    @wrap_query_error("Failed to list aircraft")
+    def find_all(self, limit: Optional[int] = None) -> List[Aircraft]:
+        """Return every aircraft, optionally capped server-side.
+
+        The cap fuses with the ordered scan on the server, so rows past
+        ``limit`` are never materialized or sent over the wire.
+        """
+        if limit is None:
+            query, params = self._Q_FIND_ALL, {}
+        else:
+            query, params = self._Q_FIND_ALL_LIMIT, {"limit": limit}
+
+        def work(tx):
+            return _validated_rows(Aircraft, tx.run(query, params), "a")
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to list aircraft")
+    def find_all_rows(self) -> List[AircraftRow]:
+        """Return every aircraft as lightweight slotted rows.
+
+        For bulk read paths that don't need Pydantic features downstream:
+        each row is a frozen slots dataclass, roughly half the memory and
+        construction cost of a model instance. Use :meth:`find_all` when
+        validated models are required at the boundary.
+        """
+        query = self._Q_FIND_ALL
+
+        def work(tx):
+            return [
+                row_from_dict(AircraftRow, record["a"])
+                for record in tx.run(query)
+            ]
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to list aircraft")
+    def find_all_raw(self, limit: Optional[int] = None) -> List[dict]:
+        """Return aircraft as the plain dicts the driver already built.
+
+        For callers that immediately re-serialize — MCP tool handlers
+        JSON-encode the response anyway — constructing models is pure
+        deserialize/reserialize overhead. Use :meth:`find_all` when
+        validated models are wanted.
+        """
+        if limit is None:
+            query, params = self._Q_FIND_ALL, {}
+        else:
+            query, params = self._Q_FIND_ALL_LIMIT, {"limit": limit}
+
+        def work(tx):
+            return tx.run(query, params).value("a")
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    def iter_all(self, limit: Optional[int] = None) -> Iterator[Aircraft]:
+        """Stream aircraft lazily instead of materializing the full list.
+
+        Yields rows as the driver pulls them, so peak memory stays at one
+        fetch batch however large the label is; the underlying session
+        remains open until the generator is exhausted.
+        """
+        if limit is None:
+            query, params = self._Q_ITER_ALL, {}
+        else:
+            query, params = self._Q_FIND_ALL_LIMIT, {"limit": limit}
+        construct = Aircraft.model_construct
+        for record in self.connection.iter_query(query, params):
+            yield construct(**record["a"])
+
+    @wrap_query_error("Failed to update aircraft")
+    def update(self, aircraft: Aircraft) -> Optional[Aircraft]:
+        """Update an existing aircraft, or return ``None`` if absent.
+
+        The MATCH and the existence check share one statement — the
+        scalar RETURN after SET says whether a node matched — so the
+        former follow-up ``find_by_id`` round-trip is gone, and on
+        success the input model is already the stored state.
+        """
+        query = self._Q_UPDATE
+
+        def work(tx):
+            return tx.run(query, props=_params_of(aircraft)).single(strict=False)
+
+        with self.connection.get_session() as session:
+            record = session.execute_write(work)
+        self.invalidate(aircraft.aircraft_id)
+        return None if record is None else aircraft
+
+    @wrap_query_error("Failed to delete aircraft")
+    def delete(self, aircraft_id: str) -> None:
+        """Delete an aircraft and its relationships."""
+        query = self._Q_DELETE
+
+        def work(tx):
+            tx.run(query, aircraft_id=aircraft_id).consume()
+
+        with self.connection.get_session() as session:
+            session.execute_write(work)
+        self.invalidate(aircraft_id)
+
+    @wrap_query_error("Failed to get systems")
+    def get_systems(self, aircraft_id: str) -> List[System]:
+        """Return the systems installed on an aircraft.
+
+        Building a full detail view? :meth:`find_bundle` fetches systems,
+        flights, and events in one round-trip.
+        """
+        return self._many(
+            System, self._Q_GET_SYSTEMS, "s", aircraft_id=aircraft_id
+        )
+
+    @wrap_query_error("Failed to get flights")
+    def get_flights(self, aircraft_id: str) -> List[Flight]:
+        """Return the flights operated by an aircraft; see also
+        :meth:`find_bundle` for the combined one-round-trip view."""
+        return self._many(
+            Flight, self._Q_GET_FLIGHTS, "f", aircraft_id=aircraft_id
+        )
+
+    @wrap_query_error("Failed to get maintenance events")
+    def get_maintenance_events(self, aircraft_id: str) -> List[MaintenanceEvent]:
+        """Return the maintenance events affecting an aircraft; see also
+        :meth:`find_bundle` for the combined one-round-trip view."""
+        return self._many(
+            MaintenanceEvent,
+            self._Q_GET_MAINTENANCE_EVENTS,
+            "m",
+            aircraft_id=aircraft_id,
+        )
+
+    def get_components(self, aircraft_id: str) -> List[Component]:
+        """Return every component across all of an aircraft's systems."""
+        return self.get_components_bulk([aircraft_id]).get(aircraft_id, [])
+
+    @wrap_query_error("Failed to get components")
+    def get_components_bulk(
+        self, aircraft_ids: List[str]
+    ) -> Dict[str, List[Component]]:
+        """Return components per aircraft for many aircraft in one query.
+
+        Collapses the N+1 pattern of calling :meth:`get_components` per
+        aircraft into a single round-trip, grouping with ``collect()`` on
+        the server.
+        """
+        query = self._Q_GET_COMPONENTS_BULK
+
+        def work(tx):
+            return {
+                record["aircraft_id"]: _items(Component, record["components"])
+                for record in tx.run(query, aircraft_ids=aircraft_ids)
+            }
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to load aircraft bundle")
+    def find_bundle(
+        self,
+        aircraft_id: str,
+        flight_limit: int = 100,
+        event_limit: int = 100,
+    ) -> Optional[AircraftBundle]:
+        """Load an aircraft with its flights, systems, and events at once.
+
+        A detail view that calls the per-relation finders separately pays
+        four round-trips; this collects all three fan-outs in one query —
+        each aggregated in its own stage, in the same order the
+        per-relation finders use — and returns them as an
+        :class:`AircraftBundle`.
+        """
+        query = self._Q_FIND_BUNDLE
+
+        def work(tx):
+            record = tx.run(
+                query,
+                aircraft_id=aircraft_id,
+                flight_limit=flight_limit,
+                event_limit=event_limit,
+            ).single(strict=False)
+            if record is None:
+                return None
+            return AircraftBundle(
+                aircraft=Aircraft(**record["a"]),
+                flights=_items(Flight, record["flights"]),
+                systems=_items(System, record["systems"]),
+                events=_items(MaintenanceEvent, record["events"]),
+            )
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to find missing components")
+    def find_missing_components(
+        self, aircraft_id: str, columns: bool = False
+    ) -> object:
+        """Return components with unresolved maintenance events.
+
+        With ``columns=True``, returns parallel lists
+        (``{"component_ids": [...], "names": [...], "types": [...]}``)
+        instead of one object per row, so callers that only need a single
+        field skip constructing full models entirely.
+        """
+        query = self._Q_FIND_MISSING_COMPONENTS
+
+        def work(tx):
+            result = tx.run(query, aircraft_id=aircraft_id)
+            if not columns:
+                return _rows(Component, result, "c")
+            ids: List[str] = []
+            names: List[Optional[str]] = []
+            types: List[Optional[str]] = []
+            for record in result:
+                node = record["c"]
+                ids.append(node["component_id"])
+                names.append(node.get("name"))
+                types.append(node.get("type"))
+            return {"component_ids": ids, "names": names, "types": types}
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to find destinations")
+    def find_latest_destinations(
+        self, aircraft_id: str, limit: int = 10, columns: bool = False
+    ) -> object:
+        """Return the most recent destinations flown by an aircraft.
+
+        With ``columns=True``, returns parallel lists keyed by field name
+        rather than one dict per row — the column layout downstream
+        numeric/tabular consumers want.
+        """
+        query = self._Q_FIND_LATEST_DESTINATIONS
+
+        def work(tx):
+            result = tx.run(query, aircraft_id=aircraft_id, limit=limit)
+            if not columns:
+                return result.data()
+            flight_numbers: List[Optional[str]] = []
+            destinations: List[Optional[str]] = []
+            departures: List[Optional[str]] = []
+            for record in result:
+                flight_numbers.append(record["flight_number"])
+                destinations.append(record["destination"])
+                departures.append(record["scheduled_departure"])
+            return {
+                "flight_numbers": flight_numbers,
+                "destinations": destinations,
+                "scheduled_departures": departures,
+            }
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+
+class AirportRepository(_BaseRepository):
+    """CRUD queries for :class:`Airport` nodes."""
+
+    _Q_CREATE = (
+        "MERGE (a:Airport {airport_id: $props.airport_id}) "
+        "SET a += $props"
+    )
+    _Q_CREATE_MANY = (
+        "UNWIND $rows AS row "
+        "MERGE (a:Airport {airport_id: row.airport_id}) "
+        "SET a += row "
+        f"RETURN {_projection(Airport, 'a')} AS a"
+    )
+    _Q_FIND_BY_ID = (
+        "MATCH (a:Airport {airport_id: $airport_id}) "
+        f"RETURN {_projection(Airport, 'a')} AS a"
+    )
+    _Q_FIND_BY_IATA = (
+        "MATCH (a:Airport {iata: $iata}) "
+        f"RETURN {_projection(Airport, 'a')} AS a"
+    )
+    _Q_FIND_BY_IATAS = (
+        "MATCH (a:Airport) WHERE a.iata IN $iatas "
+        f"RETURN {_projection(Airport, 'a')} AS a"
+    )
+    _Q_FIND_BY_IDS = (
+        "MATCH (a:Airport) WHERE a.airport_id IN $ids "
+        f"RETURN {_projection(Airport, 'a')} AS a"
+    )
+    _Q_FIND_ALL = (
+        "MATCH (a:Airport) "
+        f"RETURN {_projection(Airport, 'a')} AS a ORDER BY a.airport_id"
+    )
+    _Q_ITER_ALL = _Q_FIND_ALL
+    _Q_FIND_ALL_LIMIT = _Q_FIND_ALL + " LIMIT $limit"
+    _Q_DELETE = "MATCH (a:Airport {airport_id: $airport_id}) DETACH DELETE a"
+
+    _INDEXES = (
+        "CREATE CONSTRAINT airport_id_unique IF NOT EXISTS "
+        "FOR (a:Airport) REQUIRE a.airport_id IS UNIQUE",
+        "CREATE INDEX airport_iata_idx IF NOT EXISTS "
+        "FOR (a:Airport) ON (a.iata)",
+    )
+
+    # Airports change rarely; hot repeated lookups are served from memory
+    # for this long before touching the database again.
+    _CACHE_TTL = 300.0
+    _CACHE_MAX = 1024
+
+    def __init__(self, connection: Neo4jConnection) -> None:
+        super().__init__(connection)
+        self._cache: Dict[str, tuple] = {}
+
+    def _cache_get(self, key: str):
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _cache_put(self, key: str, value) -> None:
+        if len(self._cache) >= self._CACHE_MAX:
+            self._cache.clear()
+        self._cache[key] = (time.monotonic() + self._CACHE_TTL, value)
+
+    def invalidate(
+        self,
+        iata: Optional[str] = None,
+        airport_id: Optional[str] = None,
+    ) -> None:
+        """Drop cached airports by IATA code and/or airport_id, or the
+        whole cache; call after writes."""
+        if iata is None and airport_id is None:
+            self._cache.clear()
+            return
+        if iata is not None:
+            self._cache.pop(iata, None)
+        if airport_id is not None:
+            for key, entry in list(self._cache.items()):
+                if entry[1].airport_id == airport_id:
+                    del self._cache[key]
+
+    @classmethod
+    def ensure_indexes(cls, connection: Neo4jConnection) -> None:
+        """Create the indexes and constraints this repository depends on.
+
+        Property matches are label scans without an index; running the
+        repository's idempotent CREATE ... IF NOT EXISTS statements once
+        at startup turns them into index seeks, and the uniqueness
+        constraint on the identity property doubles as its backing index.
+        Cheap when the schema already exists.
+        """
+        with connection.unit_of_work() as tx:
+            for statement in cls._INDEXES:
+                tx.run(statement)
+
+    @wrap_query_error("Failed to create airport")
+    def create(self, airport: Airport) -> Airport:
+        """Create or update an airport node; returns the input model."""
+        query = self._Q_CREATE
+
+        def work(tx):
+            tx.run(query, props=_params_of(airport)).consume()
+
+        with self.connection.get_session() as session:
+            session.execute_write(work)
+        self.invalidate(airport.iata)
+        return airport
+
+    @wrap_query_error("Failed to create airports")
+    def create_many(self, airports: List[Airport]) -> List[Airport]:
+        """Create or update many airports in batched UNWIND statements;
+        see :meth:`AircraftRepository.create_many`."""
+        rows = [_params_of(a) for a in airports]
+
+        def work(tx, batch):
+            return _rows(Airport, tx.run(self._Q_CREATE_MANY, rows=batch), "a")
+
+        created: List[Airport] = []
+        with self.connection.get_session() as session:
+            for batch in _chunked(rows):
+                created.extend(session.execute_write(work, batch))
+        self.invalidate()
+        return created
+
+    @wrap_query_error("Failed to find airport")
+    def find_by_id(self, airport_id: str) -> Optional[Airport]:
+        """Return the airport with the given id, or ``None``."""
+        return self._one(
+            Airport, self._Q_FIND_BY_ID, "a", airport_id=airport_id
+        )
+
+    @wrap_query_error("Failed to find airport")
+    def find_by_iata(self, iata: str) -> Optional[Airport]:
+        """Return the airport with the given IATA code, or ``None``.
+
+        Hits are served from a short-lived in-process cache; the returned
+        models are frozen, so sharing one instance across callers is safe.
+        """
+        cached = self._cache_get(iata)
+        if cached is not None:
+            return cached
+        airport = self._one(Airport, self._Q_FIND_BY_IATA, "a", iata=iata)
+        if airport is None:
+            return None
+        self._cache_put(iata, airport)
+        return airport
+
+    @wrap_query_error("Failed to find airports")
+    def find_by_iatas(self, iatas: List[str]) -> Dict[str, Airport]:
+        """Fetch many airports in one round-trip, keyed by IATA code."""
+        def work(tx):
+            construct = Airport.model_construct
+            nodes = tx.run(self._Q_FIND_BY_IATAS, iatas=iatas).value("a")
+            return {node["iata"]: construct(**node) for node in nodes}
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to find airports")
+    def find_by_ids(self, ids: List[str]) -> Dict[str, Airport]:
+        """Fetch many airports in one round-trip, keyed by airport_id."""
+        def work(tx):
+            construct = Airport.model_construct
+            nodes = tx.run(self._Q_FIND_BY_IDS, ids=ids).value("a")
+            return {node["airport_id"]: construct(**node) for node in nodes}
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to list airports")
+    def find_all(self, limit: Optional[int] = None) -> List[Airport]:
+        """Return every airport, optionally capped server-side; see
+        :meth:`AircraftRepository.find_all`."""
+        if limit is None:
+            query, params = self._Q_FIND_ALL, {}
+        else:
+            query, params = self._Q_FIND_ALL_LIMIT, {"limit": limit}
+
+        def work(tx):
+            return _validated_rows(Airport, tx.run(query, params), "a")
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to list airports")
+    def find_all_rows(self) -> List[AirportRow]:
+        """Return every airport as lightweight slotted rows; see
+        :meth:`AircraftRepository.find_all_rows`."""
+        query = self._Q_FIND_ALL
+
+        def work(tx):
+            return [
+                row_from_dict(AirportRow, record["a"])
+                for record in tx.run(query)
+            ]
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    def iter_all(self, limit: Optional[int] = None) -> Iterator[Airport]:
+        """Stream airports lazily; see :meth:`AircraftRepository.iter_all`."""
+        if limit is None:
+            query, params = self._Q_ITER_ALL, {}
+        else:
+            query, params = self._Q_FIND_ALL_LIMIT, {"limit": limit}
+        construct = Airport.model_construct
+        for record in self.connection.iter_query(query, params):
+            yield construct(**record["a"])
+
+    @wrap_query_error("Failed to delete airport")
+    def delete(self, airport_id: str) -> None:
+        """Delete an airport and its relationships."""
+        query = self._Q_DELETE
+
+        def work(tx):
+            tx.run(query, airport_id=airport_id).consume()
+
+        with self.connection.get_session() as session:
+            session.execute_write(work)
+        self.invalidate(airport_id=airport_id)
+
+
+class FlightRepository(_BaseRepository):
+    """CRUD queries for :class:`Flight` nodes."""
+
+    _Q_CREATE = (
+        "MERGE (f:Flight {flight_id: $props.flight_id}) "
+        "SET f += $props"
+    )
+    _Q_CREATE_MANY = (
+        "UNWIND $rows AS row "
+        "MERGE (f:Flight {flight_id: row.flight_id}) "
+        "SET f += row "
+        f"RETURN {_projection(Flight, 'f')} AS f"
+    )
+    _Q_BULK_LOAD = (
+        "CALL apoc.periodic.iterate("
+        "'UNWIND $rows AS row RETURN row', "
+        "'MERGE (f:Flight {flight_id: row.flight_id}) SET f += row', "
+        "{batchSize: $batch_size, parallel: $parallel, "
+        "params: {rows: $rows}}) "
+        "YIELD total, errorMessages RETURN total, errorMessages"
+    )
+    _Q_FIND_BY_ID = (
+        "MATCH (f:Flight {flight_id: $flight_id}) "
+        f"RETURN {_projection(Flight, 'f')} AS f"
+    )
+    _Q_FIND_BY_IDS = (
+        "MATCH (f:Flight) WHERE f.flight_id IN $ids "
+        f"RETURN {_projection(Flight, 'f')} AS f"
+    )
+    _Q_FIND_BY_AIRCRAFT = (
+        "MATCH (a:Aircraft {aircraft_id: $aircraft_id})"
+        "-[:OPERATES_FLIGHT]->(f:Flight) "
+        f"RETURN {_projection(Flight, 'f')} AS f ORDER BY f.scheduled_departure"
+    )
+    _Q_ITER_BY_AIRCRAFT = _Q_FIND_BY_AIRCRAFT
+    _Q_FIND_BY_AIRCRAFT_BULK = (
+        "UNWIND $aircraft_ids AS aid "
+        "MATCH (:Aircraft {aircraft_id: aid})-[:OPERATES_FLIGHT]->(f:Flight) "
+        "WITH aid, f ORDER BY f.scheduled_departure "
+        f"WITH aid, collect({_projection(Flight, 'f')}) AS flights "
+        "RETURN aid AS aircraft_id, "
+        "CASE WHEN $limit_per IS NULL THEN flights "
+        "ELSE flights[..$limit_per] END AS flights"
+    )
+    _Q_FIND_ALL = (
+        "MATCH (f:Flight) "
+        f"RETURN {_projection(Flight, 'f')} AS f ORDER BY f.flight_id"
+    )
+    _Q_ITER_ALL = _Q_FIND_ALL
+    _Q_FIND_ALL_LIMIT = _Q_FIND_ALL + " LIMIT $limit"
+    _Q_DELETE = "MATCH (f:Flight {flight_id: $flight_id}) DETACH DELETE f"
+
+    _INDEXES = (
+        "CREATE CONSTRAINT flight_id_unique IF NOT EXISTS "
+        "FOR (f:Flight) REQUIRE f.flight_id IS UNIQUE",
+        "CREATE INDEX flight_aircraft_id_idx IF NOT EXISTS "
+        "FOR (f:Flight) ON (f.aircraft_id)",
+        "CREATE INDEX flight_number_idx IF NOT EXISTS "
+        "FOR (f:Flight) ON (f.flight_number)",
+        "CREATE INDEX flight_route_idx IF NOT EXISTS "
+        "FOR (f:Flight) ON (f.origin, f.destination)",
+    )
+
+    # Flight records churn the most of any label, so the point-lookup
+    # cache keeps entries only briefly; writes through this repository
+    # invalidate eagerly.
+    _CACHE_TTL = 30.0
+    _CACHE_MAX = 4096
+
+    def __init__(self, connection: Neo4jConnection) -> None:
+        super().__init__(connection)
+        self._cache: Dict[str, tuple] = {}
+
+    def _cache_get(self, key: str):
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _cache_put(self, key: str, value) -> None:
+        if len(self._cache) >= self._CACHE_MAX:
+            self._cache.clear()
+        self._cache[key] = (time.monotonic() + self._CACHE_TTL, value)
+
+    def invalidate(self, flight_id: Optional[str] = None) -> None:
+        """Drop the cached entry for one flight, or the whole cache."""
+        if flight_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(flight_id, None)
+
+    @classmethod
+    def ensure_indexes(cls, connection: Neo4jConnection) -> None:
+        """Create the indexes and constraints this repository depends on.
+
+        Property matches are label scans without an index; running the
+        repository's idempotent CREATE ... IF NOT EXISTS statements once
+        at startup turns them into index seeks, and the uniqueness
+        constraint on the identity property doubles as its backing index.
+        Cheap when the schema already exists.
+        """
+        with connection.unit_of_work() as tx:
+            for statement in cls._INDEXES:
+                tx.run(statement)
+
+    @wrap_query_error("Failed to create flight")
+    def create(self, flight: Flight) -> Flight:
+        """Create or update a flight node; returns the input model."""
+        query = self._Q_CREATE
+
+        def work(tx):
+            tx.run(query, props=_params_of(flight)).consume()
+
+        with self.connection.get_session() as session:
+            session.execute_write(work)
+        self.invalidate(flight.flight_id)
+        return flight
+
+    @wrap_query_error("Failed to create flights")
+    def create_many(self, flights: List[Flight]) -> List[Flight]:
+        """Create or update many flights in batched UNWIND statements;
+        see :meth:`AircraftRepository.create_many`."""
+        rows = [_params_of(f) for f in flights]
+
+        def work(tx, batch):
+            return _rows(Flight, tx.run(self._Q_CREATE_MANY, rows=batch), "f")
+
+        created: List[Flight] = []
+        with self.connection.get_session() as session:
+            for batch in _chunked(rows):
+                created.extend(session.execute_write(work, batch))
+        self.invalidate()
+        return created
+
+    @wrap_query_error("Failed to bulk load flights")
+    def bulk_load(
+        self,
+        flights: List[Flight],
+        batch_size: int = 10000,
+        parallel: bool = False,
+    ) -> int:
+        """Merge a very large flight batch with ``apoc.periodic.iterate``;
+        see :meth:`AircraftRepository.bulk_load`."""
+        rows = [_params_of(f) for f in flights]
+        total = self._bulk_load(self._Q_BULK_LOAD, rows, batch_size, parallel)
+        self.invalidate()
+        return total
+
+    @wrap_query_error("Failed to find flight")
+    def find_by_id(self, flight_id: str) -> Optional[Flight]:
+        """Return the flight with the given id, or ``None``.
+
+        Hits are served from a short-lived in-process cache; the returned
+        models are frozen, so sharing one instance across callers is safe.
+        Looking up many flights in a loop? Use :meth:`find_by_ids`,
+        which fetches them all in one round-trip.
+        """
+        cached = self._cache_get(flight_id)
+        if cached is not None:
+            return cached
+        flight = self._one(Flight, self._Q_FIND_BY_ID, "f", flight_id=flight_id)
+        if flight is not None:
+            self._cache_put(flight_id, flight)
+        return flight
+
+    @wrap_query_error("Failed to find flights")
+    def find_by_ids(self, ids: List[str]) -> Dict[str, Flight]:
+        """Fetch many flights in one round-trip, keyed by flight_id."""
+        def work(tx):
+            construct = Flight.model_construct
+            nodes = tx.run(self._Q_FIND_BY_IDS, ids=ids).value("f")
+            return {
+                node["flight_id"]: construct(**node) for node in nodes
+            }
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to find flights")
+    def find_by_aircraft(self, aircraft_id: str) -> List[Flight]:
+        """Return the flights assigned to an aircraft.
+
+        Starts at the aircraft node and follows ``OPERATES_FLIGHT``
+        adjacency — O(degree) — rather than index-seeking every Flight by
+        its ``aircraft_id`` property.
+        """
+        return self._many(
+            Flight, self._Q_FIND_BY_AIRCRAFT, "f", aircraft_id=aircraft_id
+        )
+
+    def iter_by_aircraft(self, aircraft_id: str) -> Iterator[Flight]:
+        """Stream an aircraft's flights lazily; see :meth:`find_by_aircraft`."""
+        query = self._Q_ITER_BY_AIRCRAFT
+        construct = Flight.model_construct
+        for record in self.connection.iter_query(
+            query, {"aircraft_id": aircraft_id}
+        ):
+            yield construct(**record["f"])
+
+    @wrap_query_error("Failed to find flights")
+    def find_by_aircraft_bulk(
+        self, aircraft_ids: List[str], limit_per: Optional[int] = None
+    ) -> Dict[str, List[Flight]]:
+        """Return flights per aircraft for many aircraft in one query.
+
+        ``limit_per`` caps the flights kept per aircraft — the slice runs
+        server-side on the collected list, so capped rows never cross the
+        wire.
+        """
+        query = self._Q_FIND_BY_AIRCRAFT_BULK
+
+        def work(tx):
+            return {
+                record["aircraft_id"]: _items(Flight, record["flights"])
+                for record in tx.run(
+                    query, aircraft_ids=aircraft_ids, limit_per=limit_per
+                )
+            }
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to list flights")
+    def find_all(self, limit: Optional[int] = None) -> List[Flight]:
+        """Return every flight, optionally capped server-side; see
+        :meth:`AircraftRepository.find_all`."""
+        if limit is None:
+            query, params = self._Q_FIND_ALL, {}
+        else:
+            query, params = self._Q_FIND_ALL_LIMIT, {"limit": limit}
+
+        def work(tx):
+            return _validated_rows(Flight, tx.run(query, params), "f")
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+
+    @wrap_query_error("Failed to list flights")
+    def find_all_rows(self) -> List[FlightRow]:
+        """Return every flight as lightweight slotted rows; see
+        :meth:`AircraftRepository.find_all_rows`."""
+        query = self._Q_FIND_ALL
+
+        def work(tx):
+            return [
+                row_from_dict(FlightRow, record["f"])
+                for record in tx.run(query)
+            ]
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to list flights")
+    def find_all_raw(self, limit: Optional[int] = None) -> List[dict]:
+        """Return flights as plain dicts; see
+        :meth:`AircraftRepository.find_all_raw`."""
+        if limit is None:
+            query, params = self._Q_FIND_ALL, {}
+        else:
+            query, params = self._Q_FIND_ALL_LIMIT, {"limit": limit}
+
+        def work(tx):
+            return tx.run(query, params).value("f")
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    def iter_all(self, limit: Optional[int] = None) -> Iterator[Flight]:
+        """Stream flights lazily; see :meth:`AircraftRepository.iter_all`."""
+        if limit is None:
+            query, params = self._Q_ITER_ALL, {}
+        else:
+            query, params = self._Q_FIND_ALL_LIMIT, {"limit": limit}
+        construct = Flight.model_construct
+        for record in self.connection.iter_query(query, params):
+            yield construct(**record["f"])
+
+    @wrap_query_error("Failed to delete flight")
+    def delete(self, flight_id: str) -> None:
+        """Delete a flight and its relationships."""
+        query = self._Q_DELETE
+
+        def work(tx):
+            tx.run(query, flight_id=flight_id).consume()
+
+        with self.connection.get_session() as session:
+            session.execute_write(work)
+        self.invalidate(flight_id)
+
+
+class SystemRepository(_BaseRepository):
+    """CRUD queries for :class:`System` nodes."""
+
+    _Q_CREATE = (
+        "MERGE (s:System {system_id: $props.system_id}) "
+        "SET s += $props"
+    )
+    _Q_CREATE_MANY = (
+        "UNWIND $rows AS row "
+        "MERGE (s:System {system_id: row.system_id}) "
+        "SET s += row "
+        f"RETURN {_projection(System, 's')} AS s"
+    )
+    _Q_FIND_BY_ID = (
+        "MATCH (s:System {system_id: $system_id}) "
+        f"RETURN {_projection(System, 's')} AS s"
+    )
+    _Q_FIND_BY_IDS = (
+        "MATCH (s:System) WHERE s.system_id IN $ids "
+        f"RETURN {_projection(System, 's')} AS s"
+    )
+    _Q_FIND_BY_AIRCRAFT = (
+        "MATCH (a:Aircraft {aircraft_id: $aircraft_id})-[:HAS_SYSTEM]->(s:System) "
+        f"RETURN {_projection(System, 's')} AS s ORDER BY s.system_id"
+    )
+    _Q_FIND_ALL = (
+        "MATCH (s:System) "
+        f"RETURN {_projection(System, 's')} AS s ORDER BY s.system_id"
+    )
+    _Q_ITER_ALL = _Q_FIND_ALL
+    _Q_FIND_ALL_LIMIT = _Q_FIND_ALL + " LIMIT $limit"
+
+    _INDEXES = (
+        "CREATE CONSTRAINT system_id_unique IF NOT EXISTS "
+        "FOR (s:System) REQUIRE s.system_id IS UNIQUE",
+    )
+
+    # Installed systems change about as rarely as airports; repeated id
+    # lookups are served from memory for this long before re-querying.
+    _CACHE_TTL = 300.0
+    _CACHE_MAX = 1024
+
+    def __init__(self, connection: Neo4jConnection) -> None:
+        super().__init__(connection)
+        self._cache: Dict[str, tuple] = {}
+
+    def _cache_get(self, key: str):
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _cache_put(self, key: str, value) -> None:
+        if len(self._cache) >= self._CACHE_MAX:
+            self._cache.clear()
+        self._cache[key] = (time.monotonic() + self._CACHE_TTL, value)
+
+    def invalidate(self, system_id: Optional[str] = None) -> None:
+        """Drop one cached system, or the whole cache; call after writes."""
+        if system_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(system_id, None)
+
+    @classmethod
+    def ensure_indexes(cls, connection: Neo4jConnection) -> None:
+        """Create the indexes and constraints this repository depends on.
+
+        Property matches are label scans without an index; running the
+        repository's idempotent CREATE ... IF NOT EXISTS statements once
+        at startup turns them into index seeks, and the uniqueness
+        constraint on the identity property doubles as its backing index.
+        Cheap when the schema already exists.
+        """
+        with connection.unit_of_work() as tx:
+            for statement in cls._INDEXES:
+                tx.run(statement)
+
+    @wrap_query_error("Failed to create system")
+    def create(self, system: System) -> System:
+        """Create or update a system node; returns the input model."""
+        query = self._Q_CREATE
+
+        def work(tx):
+            tx.run(query, props=_params_of(system)).consume()
+
+        with self.connection.get_session() as session:
+            session.execute_write(work)
+        self.invalidate(system.system_id)
+        return system
+
+    @wrap_query_error("Failed to create systems")
+    def create_many(self, systems: List[System]) -> List[System]:
+        """Create or update many systems in batched UNWIND statements;
+        see :meth:`AircraftRepository.create_many`."""
+        rows = [_params_of(s) for s in systems]
+
+        def work(tx, batch):
+            return _rows(System, tx.run(self._Q_CREATE_MANY, rows=batch), "s")
+
+        created: List[System] = []
+        with self.connection.get_session() as session:
+            for batch in _chunked(rows):
+                created.extend(session.execute_write(work, batch))
+        self.invalidate()
+        return created
+
+    @wrap_query_error("Failed to find system")
+    def find_by_id(self, system_id: str) -> Optional[System]:
+        """Return the system with the given id, or ``None``.
+
+        Hits are served from a short-lived in-process cache; the returned
+        models are frozen, so sharing one instance across callers is safe.
+        Looking up many systems in a loop? Use :meth:`find_by_ids`,
+        which fetches them all in one round-trip.
+        """
+        cached = self._cache_get(system_id)
+        if cached is not None:
+            return cached
+        system = self._one(System, self._Q_FIND_BY_ID, "s", system_id=system_id)
+        if system is None:
+            return None
+        self._cache_put(system_id, system)
+        return system
+
+    @wrap_query_error("Failed to find systems")
+    def find_by_ids(self, ids: List[str]) -> Dict[str, System]:
+        """Fetch many systems in one round-trip, keyed by system_id."""
+        def work(tx):
+            construct = System.model_construct
+            nodes = tx.run(self._Q_FIND_BY_IDS, ids=ids).value("s")
+            return {
+                node["system_id"]: construct(**node) for node in nodes
+            }
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to find systems")
+    def find_by_aircraft(self, aircraft_id: str) -> List[System]:
+        """Return the systems installed on an aircraft."""
+        return self._many(
+            System, self._Q_FIND_BY_AIRCRAFT, "s", aircraft_id=aircraft_id
+        )
+
+    @wrap_query_error("Failed to list systems")
+    def find_all(self, limit: Optional[int] = None) -> List[System]:
+        """Return every system, optionally capped server-side; see
+        :meth:`AircraftRepository.find_all`."""
+        if limit is None:
+            query, params = self._Q_FIND_ALL, {}
+        else:
+            query, params = self._Q_FIND_ALL_LIMIT, {"limit": limit}
+
+        def work(tx):
+            return _validated_rows(System, tx.run(query, params), "s")
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    def iter_all(self, limit: Optional[int] = None) -> Iterator[System]:
+        """Stream systems lazily; see :meth:`AircraftRepository.iter_all`."""
+        if limit is None:
+            query, params = self._Q_ITER_ALL, {}
+        else:
+            query, params = self._Q_FIND_ALL_LIMIT, {"limit": limit}
+        construct = System.model_construct
+        for record in self.connection.iter_query(query, params):
+            yield construct(**record["s"])
+
+
+class MaintenanceEventRepository(_BaseRepository):
+    """CRUD queries for :class:`MaintenanceEvent` nodes."""
+
+    _Q_CREATE = (
+        "MERGE (m:MaintenanceEvent {event_id: $props.event_id}) "
+        "SET m += $props"
+    )
+    _Q_CREATE_MANY = (
+        "UNWIND $rows AS row "
+        "MERGE (m:MaintenanceEvent {event_id: row.event_id}) "
+        "SET m += row "
+        f"RETURN {_projection(MaintenanceEvent, 'm')} AS m"
+    )
+    _Q_BULK_LOAD = (
+        "CALL apoc.periodic.iterate("
+        "'UNWIND $rows AS row RETURN row', "
+        "'MERGE (m:MaintenanceEvent {event_id: row.event_id}) SET m += row', "
+        "{batchSize: $batch_size, parallel: $parallel, "
+        "params: {rows: $rows}}) "
+        "YIELD total, errorMessages RETURN total, errorMessages"
+    )
+    _Q_FIND_BY_ID = (
+        "MATCH (m:MaintenanceEvent {event_id: $event_id}) "
+        f"RETURN {_projection(MaintenanceEvent, 'm')} AS m"
+    )
+    _Q_FIND_BY_IDS = (
+        "MATCH (m:MaintenanceEvent) WHERE m.event_id IN $ids "
+        f"RETURN {_projection(MaintenanceEvent, 'm')} AS m"
+    )
+    _Q_FIND_BY_AIRCRAFT = (
+        "MATCH (m:MaintenanceEvent)-[:AFFECTS_AIRCRAFT]->"
+        "(a:Aircraft {aircraft_id: $aircraft_id}) "
+        "WHERE $severity IS NULL OR m.severity = $severity "
+        f"RETURN {_projection(MaintenanceEvent, 'm')} AS m "
+        "ORDER BY m.reported_at"
+    )
+    _Q_FIND_BY_AIRCRAFT_BULK = (
+        "MATCH (m:MaintenanceEvent)-[:AFFECTS_AIRCRAFT]->(a:Aircraft) "
+        "WHERE a.aircraft_id IN $aircraft_ids "
+        "WITH a, m ORDER BY m.reported_at "
+        "RETURN a.aircraft_id AS aircraft_id, "
+        f"collect({_projection(MaintenanceEvent, 'm')}) AS events"
+    )
+    _Q_FIND_BY_SEVERITY = (
+        "MATCH (m:MaintenanceEvent) "
+        "WHERE m.severity = $severity "
+        f"RETURN {_projection(MaintenanceEvent, 'm')} AS m ORDER BY m.reported_at"
+    )
+    _Q_FIND_ALL = (
+        "MATCH (m:MaintenanceEvent) "
+        f"RETURN {_projection(MaintenanceEvent, 'm')} AS m ORDER BY m.event_id"
+    )
+    _Q_ITER_ALL = _Q_FIND_ALL
+    _Q_FIND_ALL_LIMIT = _Q_FIND_ALL + " LIMIT $limit"
+
+    _INDEXES = (
+        "CREATE CONSTRAINT maintenance_event_id_unique IF NOT EXISTS "
+        "FOR (m:MaintenanceEvent) REQUIRE m.event_id IS UNIQUE",
+        "CREATE INDEX maintenance_event_severity_idx IF NOT EXISTS "
+        "FOR (m:MaintenanceEvent) ON (m.severity)",
+        "CREATE INDEX maintenance_event_reported_at_idx IF NOT EXISTS "
+        "FOR (m:MaintenanceEvent) ON (m.reported_at)",
+    )
+
+    @classmethod
+    def ensure_indexes(cls, connection: Neo4jConnection) -> None:
+        """Create the indexes and constraints this repository depends on.
+
+        Property matches are label scans without an index; running the
+        repository's idempotent CREATE ... IF NOT EXISTS statements once
+        at startup turns them into index seeks, and the uniqueness
+        constraint on the identity property doubles as its backing index.
+        Cheap when the schema already exists.
+        """
+        with connection.unit_of_work() as tx:
+            for statement in cls._INDEXES:
+                tx.run(statement)
+
+    @wrap_query_error("Failed to create maintenance event")
+    def create(self, event: MaintenanceEvent) -> MaintenanceEvent:
+        """Create or update a maintenance event node.
+
+        Ingesting a batch? Use :meth:`create_many`, which merges the whole
+        list in one statement and one commit.
+
+        Returns the input model: after the MERGE the stored state equals
+        it, so the node is not serialized back over the wire.
+        """
+        query = self._Q_CREATE
+
+        def work(tx):
+            tx.run(query, props=_params_of(event)).consume()
+
+        with self.connection.get_session() as session:
+            session.execute_write(work)
+        return event
+
+    @wrap_query_error("Failed to create maintenance events")
+    def create_many(
+        self, events: List[MaintenanceEvent]
+    ) -> List[MaintenanceEvent]:
+        """Create or update many maintenance events in one UNWIND statement;
+        see :meth:`AircraftRepository.create_many`."""
+        rows = [_params_of(event) for event in events]
+
+        def work(tx, batch):
+            return _rows(
+                MaintenanceEvent, tx.run(self._Q_CREATE_MANY, rows=batch), "m"
+            )
+
+        created: List[MaintenanceEvent] = []
+        with self.connection.get_session() as session:
+            for batch in _chunked(rows):
+                created.extend(session.execute_write(work, batch))
+        return created
+
+    @wrap_query_error("Failed to bulk load maintenance events")
+    def bulk_load(
+        self,
+        events: List[MaintenanceEvent],
+        batch_size: int = 10000,
+        parallel: bool = False,
+    ) -> int:
+        """Merge a very large event batch with ``apoc.periodic.iterate``;
+        see :meth:`AircraftRepository.bulk_load`."""
+        rows = [_params_of(event) for event in events]
+        return self._bulk_load(self._Q_BULK_LOAD, rows, batch_size, parallel)
+
+    @wrap_query_error("Failed to find maintenance event")
+    def find_by_id(self, event_id: str) -> Optional[MaintenanceEvent]:
+        """Return the maintenance event with the given id, or ``None``.
+
+        Looking up many events in a loop? Use :meth:`find_by_ids`, which
+        fetches them all in one round-trip.
+        """
+        return self._one(
+            MaintenanceEvent, self._Q_FIND_BY_ID, "m", event_id=event_id
+        )
+
+    @wrap_query_error("Failed to find maintenance events")
+    def find_by_ids(self, ids: List[str]) -> Dict[str, MaintenanceEvent]:
+        """Fetch many maintenance events in one round-trip, keyed by event_id."""
+        def work(tx):
+            construct = MaintenanceEvent.model_construct
+            nodes = tx.run(self._Q_FIND_BY_IDS, ids=ids).value("m")
+            return {
+                node["event_id"]: construct(**node) for node in nodes
+            }
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to find maintenance events")
+    def find_by_aircraft(
+        self, aircraft_id: str, severity: Optional[str] = None
+    ) -> List[MaintenanceEvent]:
+        """Return an aircraft's maintenance events, optionally by severity.
+
+        One parameterized statement serves both cases — ``$severity IS
+        NULL`` short-circuits the filter — so the server's plan cache
+        holds a single entry instead of one per branch.
+        """
+        return self._many(
+            MaintenanceEvent,
+            self._Q_FIND_BY_AIRCRAFT,
+            "m",
+            aircraft_id=aircraft_id,
+            severity=severity,
+        )
+
+    @wrap_query_error("Failed to find maintenance events")
+    def find_by_aircraft_bulk(
+        self, aircraft_ids: List[str]
+    ) -> Dict[str, List[MaintenanceEvent]]:
+        """Return maintenance events per aircraft in one query."""
+        query = self._Q_FIND_BY_AIRCRAFT_BULK
+
+        def work(tx):
+            return {
+                record["aircraft_id"]: _items(MaintenanceEvent, record["events"])
+                for record in tx.run(query, aircraft_ids=aircraft_ids)
+            }
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    @wrap_query_error("Failed to find maintenance events")
+    def find_by_severity(self, severity: str) -> List[MaintenanceEvent]:
+        """Return every maintenance event with the given severity."""
+        return self._many(
+            MaintenanceEvent, self._Q_FIND_BY_SEVERITY, "m", severity=severity
+        )
+
+    @wrap_query_error("Failed to list maintenance events")
+    def find_all(self, limit: Optional[int] = None) -> List[MaintenanceEvent]:
+        """Return every maintenance event, optionally capped server-side; see
+        :meth:`AircraftRepository.find_all`."""
+        if limit is None:
+            query, params = self._Q_FIND_ALL, {}
+        else:
+            query, params = self._Q_FIND_ALL_LIMIT, {"limit": limit}
+
+        def work(tx):
+            return _validated_rows(MaintenanceEvent, tx.run(query, params), "m")
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+
+    @wrap_query_error("Failed to list maintenance events")
+    def find_all_rows(self) -> List[MaintenanceEventRow]:
+        """Return every maintenance event as lightweight slotted rows; see
+        :meth:`AircraftRepository.find_all_rows`."""
+        query = self._Q_FIND_ALL
+
+        def work(tx):
+            return [
+                row_from_dict(MaintenanceEventRow, record["m"])
+                for record in tx.run(query)
+            ]
+
+        with self.connection.read_session() as session:
+            return session.execute_read(work)
+
+    def iter_all(
+        self, limit: Optional[int] = None
+    ) -> Iterator[MaintenanceEvent]:
+        """Stream maintenance events lazily; see
+        :meth:`AircraftRepository.iter_all`."""
+        if limit is None:
+            query, params = self._Q_ITER_ALL, {}
+        else:
+            query, params = self._Q_FIND_ALL_LIMIT, {"limit": limit}
+        construct = MaintenanceEvent.model_construct
+        for record in self.connection.iter_query(query, params):
+            yield construct(**record["m"])
+
+
+def make_repository(model, label: str, id_field: str, parent_field=None):
+    """Generate a specialized repository class from a declarative spec.
+
+    The secondary labels (Component, Sensor, Reading, Delay) need only the
+    standard lookup trio, so their classes are rendered from one template
+    and ``exec``'d at import time. Each generated method embeds its literal
+    Cypher string (projection included) and calls a pre-bound
+    ``model_construct``, giving straight-line code with no per-call
+    dispatch through a generic base. The hand-written repositories above
+    stay as they are; they carry per-label specializations a template
+    can't express.
+    """
+    alias = label[0].lower()
+    returns = f"RETURN {_projection(model, alias)} AS {alias}"
+    q_find_by_id = f"MATCH ({alias}:{label} {{{id_field}: ${id_field}}}) {returns}"
+    q_find_all = f"MATCH ({alias}:{label}) {returns} ORDER BY {alias}.{id_field}"
+    indexes = [
+        f"CREATE CONSTRAINT {id_field}_unique IF NOT EXISTS "
+        f"FOR ({alias}:{label}) REQUIRE {alias}.{id_field} IS UNIQUE"
+    ]
+    if parent_field is not None:
+        indexes.append(
+            f"CREATE INDEX {label.lower()}_{parent_field}_idx IF NOT EXISTS "
+            f"FOR ({alias}:{label}) ON ({alias}.{parent_field})"
+        )
+    noun = model.__name__.lower()
+    name = f"{model.__name__}Repository"
+    src = [
+        f"class {name}:",
+        f'    """Generated repository for :class:`{model.__name__}` nodes."""',
+        "",
+        "    _INDEXES = _indexes",
+        "",
+        "    def __init__(self, connection):",
+        "        self.connection = connection",
+        "",
+        "    @classmethod",
+        "    def ensure_indexes(cls, connection):",
+        '        """Create the indexes and constraints this repository depends on."""',
+        "        with connection.unit_of_work() as tx:",
+        "            for statement in cls._INDEXES:",
+        "                tx.run(statement)",
+        "",
+        f'    @wrap_query_error("Failed to find {noun}")',
+        f"    def find_by_id(self, {id_field}):",
+        "        def work(tx):",
+        f"            record = tx.run({q_find_by_id!r}, {id_field}={id_field}).single(strict=False)",
+        "            if record is None:",
+        "                return None",
+        f"            return _construct(**record[{alias!r}])",
+        "",
+        "        with self.connection.read_session() as session:",
+        "            return session.execute_read(work)",
+        "",
+        f'    @wrap_query_error("Failed to list {noun}s")',
+        "    def find_all(self):",
+        "        def work(tx):",
+        f"            return _rows(_model, tx.run({q_find_all!r}), {alias!r})",
+        "",
+        "        with self.connection.read_session() as session:",
+        "            return session.execute_read(work)",
+    ]
+    if parent_field is not None:
+        q_find_by_parent = (
+            f"MATCH ({alias}:{label} {{{parent_field}: ${parent_field}}}) "
+            f"{returns} ORDER BY {alias}.{id_field}"
+        )
+        src += [
+            "",
+            f'    @wrap_query_error("Failed to find {noun}s")',
+            f"    def find_by_{parent_field}(self, {parent_field}):",
+            "        def work(tx):",
+            f"            return _rows(_model, tx.run({q_find_by_parent!r}, "
+            f"{parent_field}={parent_field}), {alias!r})",
+            "",
+            "        with self.connection.read_session() as session:",
+            "            return session.execute_read(work)",
+        ]
+    namespace = {
+        "_model": model,
+        "_construct": model.model_construct,
+        "_rows": _rows,
+        "_indexes": tuple(indexes),
+        "wrap_query_error": wrap_query_error,
+    }
+    exec("\n".join(src), namespace)
+    cls = namespace[name]
+    cls.__module__ = __name__
+    return cls
+
+
+ComponentRepository = make_repository(Component, "Component", "component_id", "system_id")
+SensorRepository = make_repository(Sensor, "Sensor", "sensor_id", "system_id")
+ReadingRepository = make_repository(Reading, "Reading", "reading_id", "sensor_id")
+DelayRepository = make_repository(Delay, "Delay", "delay_id", "flight_id")
+
+
+def ensure_all_indexes(connection: Neo4jConnection) -> None:
+    """Create every repository's indexes; call once at application startup."""
+    for repository in (
+        AircraftRepository,
+        AirportRepository,
+        FlightRepository,
+        SystemRepository,
+        MaintenanceEventRepository,
+        ComponentRepository,
+        SensorRepository,
+        ReadingRepository,
+        DelayRepository,
+    ):
+        repository.ensure_indexes(connection)
@@ -0,0 +1,112 @@
+"""Lightweight slotted row types for internal bulk result handling.
+
+The Pydantic models in :mod:`neo4j_client.models` validate data at the API
+boundary; these frozen ``slots=True`` dataclasses are their counterparts for
+internal row shaping, where values come straight from trusted Neo4j results.
+Skipping per-instance ``__dict__`` and validation roughly halves per-row
+memory and construction cost on large result sets.
+"""
+
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from typing import Any, Dict, Optional, Type, TypeVar
+
+_R = TypeVar("_R")
+
+
+def row_to_model(row, model):
+    """Convert a row back into a validated Pydantic model at the boundary."""
+    return model(**asdict(row))
+
+
+def row_from_dict(row_type: Type[_R], data: Dict[str, Any]) -> _R:
+    """Build a row, ignoring keys the row type doesn't declare."""
+    allowed = {f.name for f in fields(row_type)}
+    return row_type(**{k: v for k, v in data.items() if k in allowed})
+
+
+@dataclass(slots=True, frozen=True)
+class AircraftRow:
+    aircraft_id: str
+    tail_number: Optional[str] = None
+    icao24: Optional[str] = None
+    model: Optional[str] = None
+    operator: Optional[str] = None
+    manufacturer: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class AirportRow:
+    airport_id: str
+    iata: Optional[str] = None
+    icao: Optional[str] = None
+    name: Optional[str] = None
+    city: Optional[str] = None
+    country: Optional[str] = None
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
+class FlightRow:
+    flight_id: str
+    flight_number: Optional[str] = None
+    aircraft_id: Optional[str] = None
+    operator: Optional[str] = None
+    origin: Optional[str] = None
+    destination: Optional[str] = None
+    scheduled_departure: Optional[datetime] = None
+    scheduled_arrival: Optional[datetime] = None
+
+
+@dataclass(slots=True, frozen=True)
+class SystemRow:
+    system_id: str
+    aircraft_id: Optional[str] = None
+    name: Optional[str] = None
+    type: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class ComponentRow:
+    component_id: str
+    system_id: Optional[str] = None
+    name: Optional[str] = None
+    type: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class SensorRow:
+    sensor_id: str
+    system_id: Optional[str] = None
+    name: Optional[str] = None
+    type: Optional[str] = None
+    unit: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class ReadingRow:
+    reading_id: str
+    sensor_id: Optional[str] = None
+    timestamp: Optional[datetime] = None
+    value: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
+class MaintenanceEventRow:
+    event_id: str
+    aircraft_id: Optional[str] = None
+    system_id: Optional[str] = None
+    component_id: Optional[str] = None
+    fault: Optional[str] = None
+    severity: Optional[str] = None
+    reported_at: Optional[datetime] = None
+    corrective_action: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class DelayRow:
+    delay_id: str
+    flight_id: Optional[str] = None
+    cause: Optional[str] = None
+    minutes: Optional[int] = None